@@ -0,0 +1,230 @@
+"""
+Page-view analytics: which sections and expanders visitors open.
+
+``record()`` is all a script run pays for: it puts one tuple on a bounded
+in-memory queue and returns. When the queue is full (the disk cannot keep
+up) the event is dropped and counted in ``portfolio_analytics_dropped_total``;
+a visitor never waits on analytics.
+
+One writer thread per process (``start()``, from warmup.py) takes events off
+the queue and inserts them into ``.cache/analytics.sqlite3`` in batches, at
+most one transaction per ``FLUSH_INTERVAL``. The database runs in WAL mode,
+so the owner's summary reads never block the writer. Events still queued
+when the process exits are written by an atexit hook.
+
+What is recorded, per tenant ("" is the app's own content.json):
+- ``section``   the section a visitor arrives on and every section change.
+                With tabs navigation, tab switches happen in the browser and
+                only the first tab shown is seen;
+- ``expander``  an expander opened by a visitor, only with
+                ``PORTFOLIO_ANALYTICS_EXPANDERS=1``: observing a toggle makes
+                every expander a keyed widget with an on_change callback, so
+                opening one reruns its section fragment on the server instead
+                of staying a browser-only toggle.
+Outbound link clicks are plain ``<a href>`` navigations the server never
+sees, so they are not recorded.
+
+An event carries the Streamlit session id (a random id per browser tab) to
+count visits, and nothing else about the visitor.
+
+``summary(tenant)`` is the owner's view, shown in the maintainer sidebar
+and cached for ``SUMMARY_TTL`` seconds. ``PORTFOLIO_ANALYTICS=0`` turns
+recording off.
+
+Usage:
+    python analytics.py report [tenant]     # events and visits per section/expander
+"""
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import lru
+import metrics
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ENABLED = os.environ.get("PORTFOLIO_ANALYTICS", "1") != "0"
+TRACK_EXPANDERS = ENABLED and os.environ.get("PORTFOLIO_ANALYTICS_EXPANDERS", "0") == "1"
+CACHE_DIR = os.environ.get("PORTFOLIO_CACHE_DIR", os.path.join(APP_DIR, ".cache"))
+DB_PATH = os.environ.get("PORTFOLIO_ANALYTICS_DB", os.path.join(CACHE_DIR, "analytics.sqlite3"))
+QUEUE_SIZE = 10000
+BATCH_SIZE = 1000
+FLUSH_INTERVAL = 1.0
+EXIT_TIMEOUT = 5
+SUMMARY_DAYS = 30
+SUMMARY_TTL = 60
+SESSION_KEY = "analytics_section"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    ts REAL NOT NULL,
+    session TEXT NOT NULL,
+    tenant TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_tenant ON events (tenant, ts);
+"""
+
+_queue = queue.Queue(QUEUE_SIZE)
+_stop = threading.Event()
+_writer = None
+_start_lock = threading.Lock()
+
+
+# --- Recording (hot path) ---
+def record(kind, name, tenant="", session=None):
+    """Queues one event without blocking; dropped (and counted) when the queue is full."""
+    if not ENABLED:
+        return
+    if session is None:
+        ctx = get_script_run_ctx(suppress_warning=True)
+        session = ctx.session_id if ctx else ""
+    try:
+        _queue.put_nowait((time.time(), session, tenant, kind, name))
+    except queue.Full:
+        metrics.inc("portfolio_analytics_dropped_total")
+
+
+def record_section(title, tenant=""):
+    """Records ``title`` unless it is the section this session already showed (reruns within a page)."""
+    if not ENABLED:
+        return
+    shown = (tenant, title)
+    if st.session_state.get(SESSION_KEY) != shown:
+        st.session_state[SESSION_KEY] = shown
+        record("section", title, tenant)
+
+
+# --- Writing (one background thread) ---
+def connect(path=None):
+    import sqlite3
+    path = path or DB_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")  # WAL + NORMAL: no fsync per commit
+    db.executescript(SCHEMA)
+    return db
+
+
+def _take(first):
+    """``first`` plus whatever else is queued right now, up to ``BATCH_SIZE`` events."""
+    batch = [first] if first is not None else []
+    while len(batch) < BATCH_SIZE:
+        try:
+            event = _queue.get_nowait()
+        except queue.Empty:
+            break
+        if event is not None:
+            batch.append(event)
+    return batch
+
+
+def _write(db, batch):
+    import sqlite3
+    try:
+        with db:
+            db.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?)", batch)
+    except sqlite3.Error as e:
+        metrics.inc("portfolio_analytics_dropped_total", len(batch))
+        print(f"analytics: could not write {len(batch)} events to {DB_PATH}: {e}", file=sys.stderr)
+        return
+    metrics.inc("portfolio_analytics_written_total", len(batch))
+
+
+def _write_loop(db):
+    while True:
+        first = _queue.get()
+        if first is not None and _queue.qsize() < BATCH_SIZE:
+            _stop.wait(FLUSH_INTERVAL)  # let a batch gather; cut short at exit
+        batch = _take(first)
+        if batch:
+            _write(db, batch)
+        if _stop.is_set() and _queue.empty():
+            return
+
+
+def start():
+    """Starts the writer thread and its atexit flush, once per process."""
+    global _writer
+    if not ENABLED or _writer is not None:
+        return
+    with _start_lock:
+        if _writer is not None:
+            return
+        try:
+            db = connect()
+        except Exception as e:  # no writable .cache: run without analytics
+            print(f"analytics: could not open {DB_PATH}: {type(e).__name__}: {e}", file=sys.stderr)
+            return
+        _writer = threading.Thread(target=_write_loop, args=(db,), name="analytics-writer", daemon=True)
+        _writer.start()
+        atexit.register(flush)
+
+
+def flush(timeout=EXIT_TIMEOUT):
+    """Writes everything still queued and stops the writer; True if it finished within ``timeout``."""
+    if _writer is None:
+        return True
+    _stop.set()
+    try:
+        _queue.put_nowait(None)  # wakes a writer waiting for the next event
+    except queue.Full:
+        pass  # a full queue means the writer is busy, not waiting
+    _writer.join(timeout)
+    return not _writer.is_alive()
+
+
+def queued():
+    return _queue.qsize()
+
+
+# --- The owner's view ---
+def _query(tenant, days, path):
+    import sqlite3
+    if not os.path.exists(path):
+        return []
+    db = sqlite3.connect(path, timeout=10)
+    try:
+        return db.execute(
+            "SELECT kind, name, COUNT(*), COUNT(DISTINCT session) FROM events"
+            " WHERE tenant = ? AND ts >= ? GROUP BY kind, name"
+            " ORDER BY kind DESC, COUNT(*) DESC, name",  # sections before expanders
+            (tenant, time.time() - days * 86400)).fetchall()
+    except sqlite3.Error:
+        return []
+    finally:
+        db.close()
+
+
+def summary(tenant="", days=SUMMARY_DAYS, path=None):
+    """
+    ``[(kind, name, events, visits)]`` for ``tenant`` over the last ``days``,
+    most opened first. Cached per tenant for ``SUMMARY_TTL`` seconds, so an
+    owner's reruns do not query the database each time.
+    """
+    path = path or DB_PATH
+    version = (days, path, int(time.time() // SUMMARY_TTL))
+    return lru.memo(tenant, "analytics", version, lambda: _query(tenant, days, path))
+
+
+def report(rows):
+    """Plain-text table of ``summary()`` rows."""
+    if not rows:
+        return "No visits recorded yet."
+    width = max(len(name) for _, name, _, _ in rows)
+    lines = [f"{'':9} {'':{width}}  {'events':>7} {'visits':>7}"]
+    lines += [f"{kind:9} {name:{width}}  {events:7} {visits:7}" for kind, name, events, visits in rows]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if not sys.argv[1:] or sys.argv[1] != "report" or len(sys.argv) > 3:
+        sys.exit("usage: python analytics.py report [tenant]")
+    print(report(_query(sys.argv[2] if len(sys.argv) > 2 else "", SUMMARY_DAYS, DB_PATH)))
@@ -0,0 +1,205 @@
+"""
+Self-hosted icon assets for the portfolio.
+
+Every icon the app shows is fetched once, resized to the size it is displayed
+at and written to ``static/icons/<name>.<hash>.png``. Streamlit serves that
+folder at ``app/static/`` when ``server.enableStaticServing`` is on (see
+``.streamlit/config.toml``), so visitors no longer hit icons8 / flaticon / bsu
+directly. The file names carry a content hash, which makes it safe for a CDN
+or reverse proxy in front of the app to cache ``/app/static/icons/*`` as
+``immutable`` (Streamlit's own static route does not set Cache-Control).
+
+``fixtures/icons`` holds one stand-in PNG per icon, at the size its origin
+serves, for building without network access.
+
+Usage:
+    python assets.py build                       # fetch from the original URLs
+    python assets.py build --offline fixtures/icons
+    python assets.py build --inline-max 4096     # inline icons up to 4 KB
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+from io import BytesIO
+
+import content
+import fetch
+import lru
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.environ.get("PORTFOLIO_STATIC_DIR", os.path.join(APP_DIR, "static"))
+ICON_DIR = os.path.join(STATIC_DIR, "icons")
+MANIFEST_PATH = os.path.join(ICON_DIR, "manifest.json")
+FIXTURE_DIR = os.path.join(APP_DIR, "fixtures", "icons")
+STATIC_URL = "app/static/icons"
+
+SIDEBAR_ICON_WIDTH = 50
+SKILL_ICON_WIDTH = 75
+INLINE_MAX_BYTES = 0  # icons at or below this size are inlined as data URIs (0 = never)
+
+ICON_WIDTHS = {"sidebar": SIDEBAR_ICON_WIDTH, "skill": SKILL_ICON_WIDTH}
+
+
+def icons():
+    """``name -> (source url, display width)`` for every icon used in content.json."""
+    registry = content.icon_registry(content.load_content())
+    return {name: (url, ICON_WIDTHS[kind]) for name, (url, kind) in registry.items()}
+
+
+# --- Fetching ---
+def fetch_source(name, url, offline_dir=None):
+    """
+    Returns the raw bytes of an icon, either from the original URL or, in
+    offline mode, from ``<offline_dir>/<name>.<ext>``.
+    """
+    if offline_dir:
+        for file_name in sorted(os.listdir(offline_dir)):
+            if os.path.splitext(file_name)[0] == name:
+                with open(os.path.join(offline_dir, file_name), "rb") as f:
+                    return f.read()
+        raise FileNotFoundError(f"No fixture for icon '{name}' in {offline_dir}")
+    return fetch.fetch_bytes(url)
+
+
+def normalise(data, width):
+    """Resizes an icon to its display width and re-encodes it as an optimised PNG."""
+    from PIL import Image
+
+    img = Image.open(BytesIO(data))
+    img = img.convert("RGBA")
+    if img.width != width:
+        img = img.resize((width, max(1, round(img.height * width / img.width))), Image.LANCZOS)
+    out = BytesIO()
+    img.save(out, format="PNG", optimize=True)
+    return out.getvalue(), img.size
+
+
+# --- Build ---
+def build(offline_dir=None, inline_max=INLINE_MAX_BYTES, registry=None):
+    """
+    Fetches, resizes and writes every icon, then writes the manifest that
+    ``icon_src`` reads. Stale hashed files from earlier builds are removed.
+    An icon that cannot be fetched keeps its previous build if it has one and
+    is otherwise left out (``icon_src`` then uses its original URL).
+    """
+    registry = icons() if registry is None else registry
+    os.makedirs(ICON_DIR, exist_ok=True)
+    previous = load_manifest()
+    manifest = {}
+    for name, (url, width) in registry.items():
+        try:
+            png, (w, h) = normalise(fetch_source(name, url, offline_dir), width)
+        except Exception as e:
+            print(f"Icon {name} failed, skipping it: {type(e).__name__}: {e}", file=sys.stderr)
+            if _matches(previous.get(name), url, width):
+                manifest[name] = previous[name]
+            continue
+        digest = hashlib.sha256(png).hexdigest()[:12]
+        file_name = f"{name}.{digest}.png"
+        path = os.path.join(ICON_DIR, file_name)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(png)
+        entry = {"file": file_name, "source": url, "width": w, "height": h, "bytes": len(png)}
+        if inline_max and len(png) <= inline_max:
+            entry["data_uri"] = "data:image/png;base64," + base64.b64encode(png).decode("ascii")
+        manifest[name] = entry
+
+    keep = {entry["file"] for entry in manifest.values()} | {"manifest.json"}
+    for file_name in os.listdir(ICON_DIR):
+        if file_name not in keep:
+            os.remove(os.path.join(ICON_DIR, file_name))
+
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+    return manifest
+
+
+def ensure_icons(offline_dir=None):
+    """
+    Builds the icons unless the manifest already has every icon content.json
+    uses, from the same URL at the same width. Called once at app startup;
+    failures are reported and ``icon_src`` falls back to the original URLs.
+    """
+    manifest = load_manifest()
+    registry = icons()
+    if all(_matches(manifest.get(name), url, width) for name, (url, width) in registry.items()):
+        return manifest
+    try:
+        return build(offline_dir=offline_dir, registry=registry)
+    except Exception as e:
+        print(f"Icon build failed, using remote icon URLs: {e}", file=sys.stderr)
+        return {}
+
+
+# --- Lookup ---
+_manifest_cache = {"mtime": None, "data": {}}
+
+
+def load_manifest():
+    """Reads the manifest, re-reading it only when the file changes."""
+    try:
+        mtime = os.path.getmtime(MANIFEST_PATH)
+    except OSError:
+        return {}
+    if _manifest_cache["mtime"] != mtime:
+        with open(MANIFEST_PATH) as f:
+            _manifest_cache["data"] = json.load(f)
+        _manifest_cache["mtime"] = mtime
+    return _manifest_cache["data"]
+
+
+def _matches(entry, url, width):
+    """Whether a manifest entry was built from ``url`` at ``width``."""
+    return entry is not None and entry.get("source") == url and entry.get("width") == width
+
+
+def icon_src(name):
+    """
+    Returns the ``<img src>`` for an icon: data URI, local static path or
+    original URL. A built icon whose source URL has since changed in
+    content.json is not used.
+    """
+    url, width = icons()[name]
+    entry = load_manifest().get(name)
+    if not _matches(entry, url, width):
+        return url
+    return entry.get("data_uri") or f"{STATIC_URL}/{entry['file']}"
+
+
+def tenant_icon_src(owner, name, url, width):
+    """
+    ``<img src>`` for an icon the registry does not know (a tenant's own, see
+    tenants.py): fetched once, resized like the built icons and kept as a
+    data URI in the shared LRU under ``owner``'s quota, so pages never link
+    to the icon's origin. An icon that cannot be fetched is left out.
+    """
+    return lru.memo(owner, f"icon:{name}", (url, width), lambda: _tenant_icon(name, url, width))
+
+
+def _tenant_icon(name, url, width):
+    try:
+        data, _ = normalise(fetch_source(name, url), width)
+    except Exception as e:
+        print(f"Icon '{name}' unavailable ({url}): {type(e).__name__}: {e}", file=sys.stderr)
+        return ""
+    return "data:image/png;base64," + base64.b64encode(data).decode("ascii")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the self-hosted icon assets.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--offline", nargs="?", const=FIXTURE_DIR, default=None,
+                        help=f"read icons from a fixture directory instead of the network (default: {FIXTURE_DIR})")
+    parser.add_argument("--inline-max", type=int, default=INLINE_MAX_BYTES,
+                        help="inline icons up to this many bytes as data URIs")
+    args = parser.parse_args()
+    result = build(offline_dir=args.offline, inline_max=args.inline_max)
+    for icon_name, icon in sorted(result.items()):
+        mode = "inline" if "data_uri" in icon else icon["file"]
+        print(f"{icon_name:10} {icon['width']:>3}x{icon['height']:<3} {icon['bytes']:>6} B  {mode}")
@@ -0,0 +1,195 @@
+"""
+Analytics overhead: what recording an event costs a script run.
+
+Writes to a temp SQLite file and checks:
+
+1. overflow: with the writer stopped and a small queue, ``record()`` never
+   blocks; the extra events are dropped and counted;
+2. concurrency: ``--threads`` threads (1, 8 and 32 by default, like that many
+   sessions rerunning at once) call ``record()`` while the writer flushes
+   batches to SQLite. The p99 cost per call stays under ``MAX_RECORD_US``,
+   and every event that was not dropped ends up in the database;
+3. in the app: haha.py under AppTest, ``--sessions`` sessions switching
+   sections (radio navigation, two reruns per section). The analytics work
+   per rerun stays under ``MAX_RERUN_US`` at p95, and the owner summary
+   counts one view per arrival and section change, not per rerun;
+4. shutdown: a child process records ``EXIT_EVENTS`` events and exits right
+   away; the atexit flush writes all of them.
+
+Usage:
+    python benchmarks/analytics_bench.py [--threads 1 8 32] [--events 20000] [--sessions 8]
+"""
+import argparse
+import os
+import queue
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from apptest_utils import app_test
+
+import analytics  # noqa: E402
+import metrics  # noqa: E402
+import sections  # noqa: E402
+import warmup  # noqa: E402
+
+MAX_RECORD_US = 50
+MAX_RERUN_US = 200
+EXIT_EVENTS = 5000
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def rows(path):
+    with sqlite3.connect(path) as db:
+        return db.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+def dropped():
+    return sum(v for (name, _), v in metrics.snapshot().items() if name == "portfolio_analytics_dropped_total")
+
+
+def record_from_threads(count, events):
+    """Per-call times (us) of ``events`` record() calls split over ``count`` threads started together."""
+    times = []
+    barrier = threading.Barrier(count)
+
+    def worker(n):
+        own = []
+        barrier.wait()
+        for i in range(events // count):
+            start = time.perf_counter_ns()
+            analytics.record("section", "Home", "bench", f"session-{n}")
+            own.append((time.perf_counter_ns() - start) / 1000)
+        times.extend(own)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return times
+
+
+def child(path):
+    """``--child``: records EXIT_EVENTS events and exits without flushing by hand."""
+    analytics.DB_PATH = path
+    analytics.start()
+    for i in range(EXIT_EVENTS):
+        analytics.record("section", "Home", "exit-test", f"session-{i % 50}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(args.child)
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        analytics.DB_PATH = os.path.join(tmp_dir, "analytics.sqlite3")
+
+        # 1. Overflow, before the writer runs: a full queue drops, it never blocks.
+        analytics._queue = queue.Queue(100)
+        before = dropped()
+        start = time.perf_counter()
+        for _ in range(1000):
+            analytics.record("section", "Home", "overflow", "s")
+        elapsed_us = (time.perf_counter() - start) * 1e6 / 1000
+        lost = dropped() - before
+        print(f"overflow: 1000 events into a 100-slot queue, {lost} dropped, {elapsed_us:.2f} us per call")
+        if lost != 900:
+            failures.append(f"overflow dropped {lost} events, expected 900")
+        analytics._queue = queue.Queue(analytics.QUEUE_SIZE)
+
+        # 2. Concurrent record() while the writer flushes.
+        analytics.start()
+        print(f"{'threads':>7} {'events':>7} {'mean us':>8} {'p50 us':>7} {'p99 us':>7} {'max us':>8}")
+        recorded = 0
+        before = dropped()
+        for count in args.threads:
+            times = record_from_threads(count, args.events)
+            recorded += len(times)
+            p99 = percentile(times, 0.99)
+            print(f"{count:7} {len(times):7} {statistics.mean(times):8.2f} {statistics.median(times):7.2f} "
+                  f"{p99:7.2f} {max(times):8.1f}")
+            if p99 > MAX_RECORD_US:
+                failures.append(f"{count} threads: record() p99 {p99:.1f} us > {MAX_RECORD_US} us")
+        for _ in range(100):
+            if analytics.queued() == 0:
+                break
+            time.sleep(0.05)
+        time.sleep(analytics.FLUSH_INTERVAL + 0.5)  # the last batch's transaction
+        lost = dropped() - before
+        stored = rows(analytics.DB_PATH)
+        print(f"stored {stored} of {recorded} events ({lost} dropped)")
+        if stored != recorded - lost:
+            failures.append(f"{recorded - lost - stored} recorded events missing from the database")
+
+        # 3. In the app: the analytics share of each rerun.
+        sessions = [app_test({"PORTFOLIO_NAV": "radio"}, timeout=60) for _ in range(args.sessions)]
+        for at in sessions:
+            at.run()
+        warmup.wait(60)  # time reruns, not the startup work competing with them
+        spent = []
+        original = analytics.record_section
+
+        def timed_record_section(*a, **kw):
+            start = time.perf_counter_ns()
+            original(*a, **kw)
+            spent.append((time.perf_counter_ns() - start) / 1000)
+
+        analytics.record_section = timed_record_section
+        menu = list(sections.MENU)
+        changes = 0
+        for i in range(args.runs):
+            at = sessions[i % len(sessions)]
+            section = menu[(i // (2 * len(sessions)) + 1) % len(menu)]  # two reruns per section
+            changes += at.sidebar.radio[0].value != section
+            at.sidebar.radio[0].set_value(section)
+            at.run()
+            if at.exception:
+                raise SystemExit(f"app run failed: {at.exception}")
+        analytics.record_section = original
+        p95 = percentile(spent, 0.95)
+        print(f"app: {len(spent)} reruns over {args.sessions} sessions, {changes} section changes, "
+              f"analytics per rerun p50 {statistics.median(spent):.1f} us, p95 {p95:.1f} us")
+        if p95 > MAX_RERUN_US:
+            failures.append(f"analytics per rerun p95 {p95:.1f} us > {MAX_RERUN_US} us")
+        analytics.flush()
+        summary = analytics._query("", analytics.SUMMARY_DAYS, analytics.DB_PATH)
+        print(analytics.report(summary))
+        seen = {name for kind, name, _, _ in summary if kind == "section"}
+        if seen != set(menu):
+            failures.append(f"summary shows sections {sorted(seen)}, expected {menu}")
+        views = sum(events for kind, _, events, _ in summary if kind == "section")
+        if views != changes + len(sessions):  # + each session's arrival
+            failures.append(f"{views} section views recorded for {changes} changes + {len(sessions)} arrivals")
+
+        # 4. Shutdown: queued events are flushed at exit.
+        exit_path = os.path.join(tmp_dir, "exit.sqlite3")
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--child", exit_path], check=True)
+        stored = rows(exit_path)
+        print(f"exit flush: {stored} of {EXIT_EVENTS} events stored")
+        if stored != EXIT_EVENTS:
+            failures.append(f"exit flush stored {stored} of {EXIT_EVENTS} events")
+
+    if failures:
+        raise SystemExit("FAILED:\n  " + "\n  ".join(failures))
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Shared helpers for the AppTest-based benchmarks."""
+import importlib
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(APP_DIR, "haha.py")
+sys.path.insert(0, APP_DIR)
+
+
+def app_test(env=None, timeout=30):
+    """
+    Returns an AppTest for haha.py with ``env`` applied to os.environ and the
+    settings module reloaded, since AppTest runs the script in this process.
+
+    AppTest builds a new ScriptCache for every run and so recompiles the
+    script each time; a server compiles it once. One shared cache keeps
+    that compile out of the timings and the memory peaks.
+    """
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import AppTest, local_script_runner
+
+    script_cache = ScriptCache()
+    local_script_runner.ScriptCache = lambda: script_cache
+
+    os.environ.update(env or {})
+    # No background link probing unless a benchmark asks for it.
+    import linkcheck
+    linkcheck.ENABLED = os.environ.get("PORTFOLIO_LINKCHECK", "0") != "0"
+    import settings
+    importlib.reload(settings)
+    return AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+
+def walk(node):
+    """Yields every element/block below ``node`` in the AppTest tree."""
+    for child in getattr(node, "children", {}).values():
+        yield child
+        yield from walk(child)
+
+
+def payload(at):
+    """(element count, HTML/markdown bytes) for everything the last run emitted."""
+    count = 0
+    html_bytes = 0
+    for node in walk(at._tree):
+        if getattr(node, "type", None) in ("markdown", "html"):
+            html_bytes += len(node.proto.body.encode("utf-8"))
+        count += 1
+    return count, html_bytes
@@ -0,0 +1,206 @@
+"""
+Locally served documents: publishing, range/ETag responses and server memory
+under concurrent downloads.
+
+Publishes a synthetic resume (a real one-page PDF when PyMuPDF is installed,
+padded to ``--size-mb``) into a temp static dir and serves it with
+Streamlit's own app-static route, the handler ``streamlit run`` mounts at
+``/app/static/``, under uvicorn in a child process. Checks:
+
+1. publish writes ``<name>.<hash>.pdf`` and, with PyMuPDF, a preview; a second
+   publish re-hashes nothing; the resume link now points at the local copy;
+2. a GET carries ETag, Last-Modified and Accept-Ranges; a Range request gets a
+   206 with exactly the requested bytes;
+3. the server's RSS grows by less than ``MAX_GROWTH_MB`` while 1, 8 and 32
+   clients download the whole file at once (reading the file into memory per
+   request would cost ``--size-mb`` per client).
+
+Usage:
+    python benchmarks/documents_check.py [--size-mb 32]
+"""
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+import apptest_utils  # noqa: F401  (puts the app on sys.path)
+
+import content  # noqa: E402
+import documents  # noqa: E402
+import render  # noqa: E402
+
+CONCURRENCY = (1, 8, 32)
+MAX_GROWTH_MB = 24
+READ_CHUNK = 64 * 1024
+
+
+# --- Server (child process) ---
+def serve(app_dir, port):
+    import uvicorn
+    from starlette.applications import Starlette
+    from streamlit.web.server.starlette.starlette_routes import create_app_static_serving_routes
+
+    app = Starlette(routes=create_app_static_serving_routes(os.path.join(app_dir, "haha.py"), None))
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def rss_mb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+class RssSampler(threading.Thread):
+    def __init__(self, pid):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.peak = 0.0
+        self.running = True
+
+    def run(self):
+        while self.running:
+            self.peak = max(self.peak, rss_mb(self.pid))
+            time.sleep(0.005)
+
+
+# --- Fixtures ---
+def make_pdf(path, size_mb):
+    try:
+        import pymupdf
+    except ImportError:
+        with open(path, "wb") as f:
+            f.write(b"%PDF-1.4\n% not a real PDF: PyMuPDF is not installed\n")
+            f.write(os.urandom(size_mb * 1024 * 1024))
+        return False
+    pdf = pymupdf.open()
+    page = pdf.new_page()
+    page.insert_text((72, 72), "Utsav Chaddha - Resume", fontsize=18)
+    pdf.embfile_add("padding.bin", os.urandom(size_mb * 1024 * 1024))
+    pdf.save(path)
+    pdf.close()
+    return True
+
+
+def download(url, headers=None):
+    request = urllib.request.Request(url, headers=headers or {})
+    with urllib.request.urlopen(request) as response:
+        size = 0
+        for chunk in iter(lambda: response.read(READ_CHUNK), b""):
+            size += len(chunk)
+        return response.status, dict(response.headers), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=32)
+    parser.add_argument("--serve", nargs=2, metavar=("APP_DIR", "PORT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        return serve(args.serve[0], int(args.serve[1]))
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # A copy of content.json whose resume source exists, published into tmp_dir/static/files.
+        shutil.copy(content.CONTENT_PATH, os.path.join(tmp_dir, "content.json"))
+        content.CONTENT_PATH = os.path.join(tmp_dir, "content.json")
+        documents.DOC_DIR = os.path.join(tmp_dir, "static", "files")
+        documents.MANIFEST_PATH = os.path.join(documents.DOC_DIR, "manifest.json")
+        documents._manifest = None
+        os.makedirs(os.path.join(tmp_dir, "files"))
+        site = content.load_content()
+        resume = next(d for d in site.documents if d.name == "resume")
+        real_pdf = make_pdf(documents.source_path(resume), args.size_mb)
+
+        start = time.perf_counter()
+        manifest = documents.publish(site)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        documents.publish(site)
+        second = time.perf_counter() - start
+        entry = manifest["resume"]
+        print(f"publish: {entry['file']} ({entry['bytes'] / 1e6:.1f} MB) in {first * 1000:.1f} ms, "
+              f"unchanged re-publish {second * 1000:.2f} ms, preview: {entry['preview']}")
+        if entry["preview"] is None and real_pdf:
+            failures.append("no preview although PyMuPDF is installed")
+        if second > first / 4:
+            failures.append("re-publishing an unchanged document re-hashed it")
+        html = render.link("Resume", resume.url)
+        if documents.STATIC_URL not in html:
+            failures.append(f"resume link not switched to the local copy: {html}")
+
+        port = free_port()
+        server = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--serve", tmp_dir, str(port)])
+        try:
+            url = f"http://127.0.0.1:{port}/app/static/files/{entry['file']}"
+            for _ in range(200):
+                try:
+                    status, headers, size = download(url)
+                    break
+                except OSError:
+                    time.sleep(0.05)
+            else:
+                raise SystemExit("server did not start")
+            print(f"GET: {status}, {size} bytes, etag {headers.get('etag')}, "
+                  f"accept-ranges {headers.get('accept-ranges')}")
+            if size != entry["bytes"] or not headers.get("etag") or not headers.get("last-modified") \
+                    or headers.get("accept-ranges") != "bytes":
+                failures.append("full GET: wrong size or missing ETag/Last-Modified/Accept-Ranges")
+
+            with open(documents.source_path(resume), "rb") as f:
+                f.seek(1000)
+                expected = f.read(500)
+            request = urllib.request.Request(url, headers={"Range": "bytes=1000-1499"})
+            with urllib.request.urlopen(request) as response:
+                body, range_status = response.read(), response.status
+                content_range = response.headers.get("content-range")
+            print(f"Range: {range_status}, {content_range}")
+            if range_status != 206 or body != expected:
+                failures.append(f"range request: status {range_status}, {len(body)} bytes")
+
+            baseline = rss_mb(server.pid)
+            print(f"server RSS idle: {baseline:.1f} MB")
+            for clients in CONCURRENCY:
+                sampler = RssSampler(server.pid)
+                sampler.start()
+                threads = [threading.Thread(target=download, args=(url,)) for _ in range(clients)]
+                start = time.perf_counter()
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+                elapsed = time.perf_counter() - start
+                sampler.running = False
+                sampler.join()
+                growth = sampler.peak - baseline
+                total_mb = clients * entry["bytes"] / 1e6
+                print(f"  {clients:3} concurrent downloads: {total_mb:7.1f} MB in {elapsed:5.2f} s, "
+                      f"peak RSS +{growth:.1f} MB")
+                if growth > MAX_GROWTH_MB:
+                    failures.append(f"{clients} downloads grew the server by {growth:.1f} MB")
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps({"size_mb": args.size_mb, "pymupdf": real_pdf}))
+    if failures:
+        raise SystemExit("FAILED:\n  " + "\n  ".join(failures))
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Elements and HTML payload per section, against the recorded baseline.
+
+Runs the same sandboxed scenarios as suite.py and prints, for each section,
+how many elements a rerun emits and how many markdown/HTML bytes it sends,
+next to the numbers in benchmarks/baseline.json.
+
+Usage:
+    python benchmarks/element_counts.py [--baseline benchmarks/baseline.json]
+"""
+import argparse
+import json
+import os
+
+from suite import run_suite
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def change(before, after):
+    return f"{after - before:+d} ({100 * (after - before) / before:+.0f}%)" if before else "n/a"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baseline", default=os.path.join(HERE, "baseline.json"))
+    args = parser.parse_args()
+    with open(args.baseline) as f:
+        baseline = json.load(f)["scenarios"]
+    current = run_suite(runs=3)["scenarios"]
+
+    print(f"{'section':14} {'elements':>18} {'change':>12}   {'html bytes':>16} {'change':>13}")
+    for name in ("home", "work_samples", "experience"):
+        b, c = baseline[name], current[name]
+        print(f"{name:14} {b['elements']:>8} -> {c['elements']:<6} {change(b['elements'], c['elements']):>12}   "
+              f"{b['html_bytes']:>6} -> {c['html_bytes']:<6} {change(b['html_bytes'], c['html_bytes']):>13}")
@@ -0,0 +1,109 @@
+"""
+Video engagement figures: migration from the old text notation, and what
+more video edits cost.
+
+Checks:
+1. the free-text counts content.json used to hold ("4.6 Million", "155k",
+   ...) parse to the numbers it holds now and format back to the same text,
+   so the page reads as before;
+2. the totals are 36,000,000 views, 312,000 reactions and 6,214 comments, and
+   the Experience bullet quoting them is filled in from them;
+3. for synthetic content with more and more video edits, parsing plus
+   compiling (the aggregation and the chart) is paid once per content hash.
+   The cached lookup a rerun does stays within ``MAX_LOOKUP_GROWTH`` x of the
+   smallest content's.
+
+Usage:
+    python benchmarks/engagement_bench.py [--sizes 4 40 400 2000]
+"""
+import argparse
+import copy
+import json
+import statistics
+import time
+
+import apptest_utils  # noqa: F401  (puts the app on sys.path)
+
+import content  # noqa: E402
+import engagement  # noqa: E402
+import render  # noqa: E402
+
+LEGACY = (  # content.json's video_edits before the switch to numbers
+    ("4.6 Million", "155k", "597"),
+    ("9.5 Million", "132k", "3.4k"),
+    ("19 Million", "18k", "1.3k"),
+    ("2.9 Million", "7k", "917"),
+)
+TOTALS = (36_000_000, 312_000, 6_214)
+MAX_LOOKUP_GROWTH = 3
+LOOKUPS = 2000
+
+
+def synthetic(base, count):
+    data = copy.deepcopy(base)
+    data["video_edits"] = [dict(edit, title=f"{edit['title']} #{i}", views=edit["views"] + i)
+                           for i in range(count // len(base["video_edits"]) + 1)
+                           for edit in base["video_edits"]][:count]
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 40, 400, 2000])
+    args = parser.parse_args()
+    failures = []
+
+    with open(content.CONTENT_PATH, encoding="utf-8") as f:
+        base = json.load(f)
+    site = content.parse_content(base)
+    for edit, legacy in zip(site.video_edits, LEGACY):
+        numbers = tuple(getattr(edit, name) for name in engagement.FIELDS)
+        parsed = tuple(engagement.parse_count(text) for text in legacy)
+        shown = tuple(line.split(": ", 1)[1] for line in engagement.stat_lines(edit))
+        if parsed != numbers or shown != legacy:
+            failures.append(f"{edit.title}: {legacy} parses to {parsed}, content.json has {numbers}, shown as {shown}")
+    legacy_data = copy.deepcopy(base)
+    for row, legacy in zip(legacy_data["video_edits"], LEGACY):
+        row.update(zip(engagement.FIELDS, legacy))
+    if content.parse_content(legacy_data) != site:
+        failures.append("content with the old text notation does not load to the same content")
+    print(f"migration: {len(LEGACY)} video edits, old notation round-trips")
+
+    totals = engagement.summarise(site.video_edits).totals
+    bullet = next(b for group in site.experience for job in group.jobs for b in job.bullets if "views" in b)
+    print(f"totals: {totals[0]:,} views, {totals[1]:,} reactions, {totals[2]:,} comments")
+    print(f"bullet: {bullet}")
+    if totals != TOTALS:
+        failures.append(f"totals {totals}, expected {TOTALS}")
+    if "{video_" in bullet or engagement.format_at_least(totals[0]) not in bullet:
+        failures.append("the Experience bullet does not quote the computed totals")
+
+    print(f"{'edits':>6} {'parse ms':>9} {'compile ms':>11} {'html KB':>8} {'lookup us':>10}")
+    lookups = []
+    for count in args.sizes:
+        data = synthetic(base, count)
+        start = time.perf_counter()
+        sized = content.parse_content(data, digest=f"bench-{count}", tenant=f"bench-{count}")
+        parse_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        compiled = render.compile_site(sized)
+        compile_ms = (time.perf_counter() - start) * 1000
+        times = []
+        for _ in range(LOOKUPS):
+            start = time.perf_counter_ns()
+            render.compile_site(sized)
+            times.append((time.perf_counter_ns() - start) / 1000)
+        lookup = statistics.median(times)
+        lookups.append(lookup)
+        html_kb = len(compiled["video_edits"].encode("utf-8")) / 1024
+        print(f"{count:6} {parse_ms:9.2f} {compile_ms:11.2f} {html_kb:8.1f} {lookup:10.2f}")
+    if lookups[-1] > MAX_LOOKUP_GROWTH * lookups[0]:
+        failures.append(f"cached lookup grew from {lookups[0]:.2f} to {lookups[-1]:.2f} us with more edits")
+
+    if failures:
+        raise SystemExit("FAILED:\n  " + "\n  ".join(failures))
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    main()
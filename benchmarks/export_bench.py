@@ -0,0 +1,100 @@
+"""
+Static export vs. Streamlit: time to first byte and visitors per second.
+
+Static: the exported bundle is served by a local ThreadingHTTPServer and hit
+by concurrent clients; TTFB is measured per request (index.html + CSS).
+Streamlit: every visitor costs a full script run before any content is sent,
+so the script run time (AppTest, all sections) is the server-side floor for
+TTFB and bounds capacity at about cores / run time.
+
+Usage:
+    python benchmarks/export_bench.py [--clients 50] [--requests 20]
+"""
+import argparse
+import functools
+import http.client
+import http.server
+import os
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from apptest_utils import app_test
+
+import export  # noqa: E402
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def bench_static(clients, requests_per_client):
+    with tempfile.TemporaryDirectory() as out_dir:
+        export.export(out_dir)
+        css = "/static/css/" + os.listdir(os.path.join(out_dir, "static", "css"))[0]
+        handler = functools.partial(QuietHandler, directory=out_dir)
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_port
+
+        def client(_):
+            ttfbs = []
+            conn = http.client.HTTPConnection("127.0.0.1", port)
+            for i in range(requests_per_client):
+                start = time.perf_counter()
+                conn.request("GET", "/" if i % 2 == 0 else css)
+                response = conn.getresponse()
+                ttfbs.append(time.perf_counter() - start)
+                response.read()
+            conn.close()
+            return ttfbs
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(clients) as pool:
+            ttfbs = [t for result in pool.map(client, range(clients)) for t in result]
+        elapsed = time.perf_counter() - start
+        server.shutdown()
+        server.server_close()
+    # Each visitor loads index.html + the stylesheet.
+    return ttfbs, clients * requests_per_client / 2 / elapsed
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+
+def bench_streamlit(runs):
+    at = app_test({"PORTFOLIO_NAV": "tabs"})
+    at.run()  # warm caches, as a long-running server would be
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    static_ttfb, static_rate = bench_static(args.clients, args.requests)
+    run_times = bench_streamlit(args.runs)
+    cores = os.cpu_count() or 1
+
+    print(f"{'':28} {'p50 ms':>8} {'p95 ms':>8} {'visitors/s':>11}")
+    print(f"{'static export':28} {statistics.median(static_ttfb) * 1000:>8.2f} "
+          f"{percentile(static_ttfb, 95) * 1000:>8.2f} {static_rate:>11.0f}")
+    print(f"{'streamlit (script run only)':28} {statistics.median(run_times) * 1000:>8.2f} "
+          f"{percentile(run_times, 95) * 1000:>8.2f} {cores / statistics.median(run_times):>11.0f}")
+    print(f"\nstatic: {args.clients} concurrent clients on a single-process Python file server; "
+          f"streamlit: upper bound with {cores} cores, excluding websocket and delta transfer.")
@@ -0,0 +1,80 @@
+"""
+Parity between the Streamlit app and the static export.
+
+Renders every section with AppTest (tabs mode, so one run shows all of them)
+and checks that each piece of text the app shows - markdown, headers,
+expander labels - also appears in dist/index.html. Exits non-zero on any
+missing text.
+
+Usage:
+    python benchmarks/export_parity.py
+"""
+import re
+import sys
+import tempfile
+from html.parser import HTMLParser
+
+from apptest_utils import app_test, walk
+
+import export  # noqa: E402
+
+
+class TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("style", "script"):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in ("style", "script"):
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def text_of(html):
+    parser = TextExtractor()
+    parser.feed(html)
+    return normalise(" ".join(parser.parts))
+
+
+def normalise(text):
+    text = re.sub(r"\*\*|__|^#+\s*|^---$", "", text, flags=re.M)  # markdown decoration
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def app_texts(at):
+    texts = []
+    for node in walk(at._tree):
+        kind = getattr(node, "type", None)
+        if kind in ("markdown", "html"):
+            texts.append(text_of(node.proto.body))
+        elif kind == "expandable":
+            texts.append(normalise(node.label))
+        elif kind in ("header", "subheader", "title"):
+            texts.append(normalise(node.value))
+    return [t for t in texts if t]
+
+
+if __name__ == "__main__":
+    at = app_test({"PORTFOLIO_NAV": "tabs"})
+    at.run()
+    if at.exception:
+        sys.exit(f"app raised: {at.exception}")
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        with open(export.export(out_dir), encoding="utf-8") as f:
+            static_text = text_of(f.read())
+
+    texts = app_texts(at)
+    missing = [t for t in texts if t not in static_text]
+    for text in missing:
+        print(f"missing from export: {text[:100]}")
+    print(f"{len(texts) - len(missing)}/{len(texts)} app text blocks found in the static export")
+    sys.exit(1 if missing else 0)
@@ -0,0 +1,98 @@
+"""
+HTTP fetch and disk cache against a local stand-in server.
+
+Fetches stub routes through ``fetch.fetch_bytes`` with a temp disk cache and
+checks the outcome of each fetch (``fetch.fetch_stats``) and what the stub saw:
+
+1. network:      the first fetch of a URL stores the body and its validators;
+2. fresh:        within ``max-age`` the disk copy is returned with no request;
+3. revalidated:  an expired entry is revalidated with If-None-Match, the stub
+                 answers 304 and the cached body is returned; an entry with
+                 only Last-Modified sends If-Modified-Since;
+4. stale on 5xx: an origin answering 500 or 503 gets the stale disk copy served;
+5. stale on unreachable: with the server gone, cached URLs are served stale
+   and an uncached one raises; a 404 raises even when a copy is cached.
+
+Usage:
+    python benchmarks/fetch_check.py
+"""
+import tempfile
+
+import apptest_utils  # noqa: F401  (puts the app on sys.path)
+from stub_server import Route, StubServer, png
+
+import fetch  # noqa: E402
+
+BODY = png("fetch-check")
+ETAG = '"v1"'
+
+ROUTES = {
+    "/etag": Route(body=BODY, headers={"ETag": ETAG}),
+    "/last-modified": Route(body=BODY, headers={"Last-Modified": "Sat, 17 Oct 2026 12:00:00 GMT"}),
+    "/max-age": Route(body=BODY, headers={"ETag": ETAG, "Cache-Control": "max-age=60"}),
+    "/error-500": Route(body=BODY, headers={"ETag": ETAG}),
+    "/error-503": Route(body=BODY, headers={"ETag": ETAG}),
+    "/gone": Route(body=BODY, headers={"ETag": ETAG}),
+}
+
+
+def fetch_once(url, cache):
+    """``(outcome, body)`` of one fetch; outcome is "error" when it raised."""
+    before = dict(fetch.fetch_stats)
+    try:
+        body = fetch.fetch_bytes(url, cache=cache)
+    except Exception as e:
+        return "error", type(e).__name__
+    changed = [name for name, count in fetch.fetch_stats.items() if count != before[name]]
+    return changed[0], body
+
+
+def main():
+    failures = []
+
+    def expect(label, got, outcome, body=BODY):
+        print(f"{label:34} {got[0]}")
+        if got[0] != outcome or (outcome != "error" and got[1] != body):
+            failures.append(f"{label}: {got[0]}, expected {outcome}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = fetch.DiskCache(tmp_dir)
+        with StubServer(ROUTES) as stub:
+            urls = {path: stub.url(path) for path in ROUTES}
+            for path, url in urls.items():
+                expect(f"first fetch {path}", fetch_once(url, cache), "network")
+
+            seen = len(stub.requests)
+            expect("within max-age", fetch_once(urls["/max-age"], cache), "fresh")
+            if len(stub.requests) != seen:
+                failures.append("a fresh entry made a request")
+
+            expect("expired, ETag", fetch_once(urls["/etag"], cache), "revalidated")
+            if stub.requests[-1][2].get("If-None-Match") != ETAG:
+                failures.append("revalidation did not send If-None-Match")
+            # The stub only honours ETags, so this one comes back whole.
+            expect("expired, Last-Modified", fetch_once(urls["/last-modified"], cache), "network")
+            if "If-Modified-Since" not in stub.requests[-1][2]:
+                failures.append("revalidation did not send If-Modified-Since")
+
+            stub.routes["/error-500"] = Route(status=500, body=b"oops")
+            stub.routes["/error-503"] = Route(status=503, body=b"busy")
+            stub.routes["/gone"] = Route(status=404, body=b"gone")
+            expect("origin answers 500", fetch_once(urls["/error-500"], cache), "stale")
+            expect("origin answers 503", fetch_once(urls["/error-503"], cache), "stale")
+            expect("origin answers 404", fetch_once(urls["/gone"], cache), "error")
+            uncached = stub.url("/never-fetched")
+
+        # The server is shut down; drop the pooled keep-alive connections its
+        # handler threads would still answer, so every request has to connect.
+        fetch.get_session().close()
+        expect("origin unreachable, cached", fetch_once(urls["/etag"], cache), "stale")
+        expect("origin unreachable, not cached", fetch_once(uncached, cache), "error")
+
+    if failures:
+        raise SystemExit("FAILED:\n  " + "\n  ".join(failures))
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Checks that section-local interactions do not re-execute the shell, and
+compares script time and deltas for a full rerun vs. a fragment rerun.
+
+A widget inside a section's ``@st.fragment`` makes the browser request a
+rerun scoped to that fragment. AppTest always requests full reruns, so this
+script issues the same fragment-scoped request (``fragment_id_queue``) that
+the frontend would. Exits non-zero if the sidebar runs during a fragment
+rerun.
+
+Usage:
+    python benchmarks/fragment_check.py
+"""
+import sys
+import time
+from unittest import mock
+
+from apptest_utils import app_test
+
+import shell  # noqa: E402  (apptest_utils puts the app on sys.path)
+from streamlit.runtime.scriptrunner_utils.script_requests import RerunData
+from streamlit.testing.v1 import local_script_runner
+
+calls = {"sidebar": 0}
+_render_sidebar = shell.render_sidebar
+
+
+def counting_sidebar(*args, **kwargs):
+    calls["sidebar"] += 1
+    return _render_sidebar(*args, **kwargs)
+
+
+def scoped_rerun_data(fragment_ids):
+    def make(**kwargs):
+        return RerunData(fragment_id_queue=list(fragment_ids), is_fragment_scoped_rerun=True, **kwargs)
+    return make
+
+
+_parse_tree = local_script_runner.parse_tree_from_messages
+last_run = {"deltas": 0}
+
+
+def counting_parse(msgs):
+    last_run["deltas"] = sum(1 for msg in msgs if msg.HasField("delta"))
+    return _parse_tree(msgs)
+
+
+if __name__ == "__main__":
+    shell.render_sidebar = counting_sidebar
+    local_script_runner.parse_tree_from_messages = counting_parse
+    at = app_test({"PORTFOLIO_NAV": "pages"})
+
+    start = time.perf_counter()
+    at.run()
+    full_ms = (time.perf_counter() - start) * 1000
+    assert not at.exception, at.exception
+    full_deltas = last_run["deltas"]
+    assert calls["sidebar"] == 1, calls
+
+    fragment_ids = list(at._fragment_storage._fragments)
+    if not fragment_ids:
+        sys.exit("no fragments registered by the page")
+
+    failures = []
+    for fragment_id in fragment_ids:
+        before = calls["sidebar"]
+        with mock.patch.object(local_script_runner, "RerunData", scoped_rerun_data([fragment_id])):
+            start = time.perf_counter()
+            at.run()
+            fragment_ms = (time.perf_counter() - start) * 1000
+        if at.exception:
+            failures.append(f"{fragment_id}: {at.exception}")
+        if calls["sidebar"] != before:
+            failures.append(f"{fragment_id}: sidebar re-executed during fragment rerun")
+        print(f"fragment {fragment_id[:12]}: {fragment_ms:7.1f} ms, {last_run['deltas']:3} deltas   "
+              f"full run: {full_ms:7.1f} ms, {full_deltas:3} deltas")
+
+    if failures:
+        sys.exit("\n".join(failures))
+    print(f"OK: sidebar executed {calls['sidebar']} time(s) across 1 full run and {len(fragment_ids)} fragment rerun(s)")
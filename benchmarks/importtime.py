@@ -0,0 +1,109 @@
+"""
+Import-time report and startup budget for the app.
+
+Runs ``python -X importtime`` on the imports at the top of haha.py (found
+with ``ast``, so the list follows the script) in fresh interpreters, and
+reports the median over a few runs of:
+    streamlit       everything ``import streamlit`` pulls in
+    app             everything haha.py's own imports add on top of it
+and the app modules and third-party packages that cost the most.
+
+The budget fails the run when the app adds more than ``--budget-ms`` or
+when a package that should only load on first real use (Pillow, requests)
+shows up at import time.
+
+Usage:
+    python benchmarks/importtime.py [--runs 5] [--budget-ms 80] [--top 12]
+"""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+from apptest_utils import APP_DIR, APP_PATH
+
+# Loaded lazily on purpose; importing them at startup is a regression.
+LAZY_PACKAGES = ("PIL", "requests", "urllib3", "sqlite3", "numpy")
+
+
+def script_imports(path=APP_PATH):
+    """Top-level module names haha.py imports, in order."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    names = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.append(node.module)
+    return names
+
+
+def parse(stderr):
+    """``[(depth, name, self_us, cumulative_us)]`` from ``-X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def one_run(modules):
+    code = "import streamlit\n" + "".join(f"import {name}\n" for name in modules if name != "streamlit")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=APP_DIR,
+                            capture_output=True, text=True, env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"))
+    if result.returncode:
+        sys.exit(result.stderr)
+    rows = parse(result.stderr)
+    # Top-level rows after the streamlit one are what the app's imports added.
+    top = [i for i, row in enumerate(rows) if row[0] == 0]
+    streamlit_at = next(i for i in top if rows[i][1] == "streamlit")
+    app_rows = rows[streamlit_at + 1:]
+    packages = {}
+    for _, name, self_us, _ in app_rows:
+        root = name.split(".")[0]
+        packages[root] = packages.get(root, 0) + self_us
+    return {
+        "streamlit": rows[streamlit_at][3],
+        "app": sum(row[3] for row in app_rows if row[0] == 0),
+        "packages": packages,
+        "modules": {row[1] for row in rows},
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=80.0,
+                        help="most milliseconds haha.py's imports may add on top of streamlit")
+    parser.add_argument("--top", type=int, default=12)
+    args = parser.parse_args()
+
+    modules = script_imports()
+    runs = [one_run(modules) for _ in range(args.runs)]
+    streamlit_ms = statistics.median(r["streamlit"] for r in runs) / 1000
+    app_ms = statistics.median(r["app"] for r in runs) / 1000
+    print(f"haha.py imports: {', '.join(modules)}")
+    print(f"streamlit  {streamlit_ms:8.1f} ms")
+    print(f"app        {app_ms:8.1f} ms  (budget {args.budget_ms:g} ms)")
+
+    names = set().union(*(r["packages"] for r in runs))
+    costs = {name: statistics.median(r["packages"].get(name, 0) for r in runs) / 1000 for name in names}
+    print(f"\nslowest packages/modules added by the app (self time, median of {args.runs} runs)")
+    for name, ms in sorted(costs.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:24} {ms:7.2f} ms")
+
+    failures = []
+    if app_ms > args.budget_ms:
+        failures.append(f"app imports take {app_ms:.1f} ms, budget is {args.budget_ms:g} ms")
+    loaded = sorted({p for p in LAZY_PACKAGES for r in runs if p in r["modules"]})
+    if loaded:
+        failures.append(f"imported at startup but meant to load lazily: {', '.join(loaded)}")
+    if failures:
+        sys.exit("\nover budget:\n  " + "\n  ".join(failures))
+    print("\nwithin budget")
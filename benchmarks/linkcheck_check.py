@@ -0,0 +1,110 @@
+"""
+Link checker against a local stand-in server.
+
+Probes a set of stub routes with assorted behaviour - 200, 404, 500, a
+server that refuses HEAD, a redirect, LinkedIn-style 999 and 429 refusals,
+a response slower than the timeout - plus a batch of slow routes on the same
+host, and checks:
+
+1. every link gets the expected state (ok / dead / blocked / error);
+2. no more than ``PER_HOST`` requests were ever in flight at the stub;
+3. a second check within the TTL makes no requests, an expired TTL re-probes;
+4. dead links come out marked in the compiled HTML, and reading a status
+   while a slow check is running does not wait for it.
+
+Usage:
+    python benchmarks/linkcheck_check.py
+"""
+import os
+import tempfile
+import threading
+import time
+
+import apptest_utils  # noqa: F401  (puts the app on sys.path)
+from stub_server import Route, StubServer
+
+import content  # noqa: E402
+import linkcheck  # noqa: E402
+import render  # noqa: E402
+
+SLOW_ROUTES = 12
+SLOW_DELAY = 0.2
+
+ROUTES = {
+    "/ok": (Route(body=b"fine"), "ok"),
+    "/missing": (Route(status=404), "dead"),
+    "/broken": (Route(status=500), "dead"),
+    "/no-head": (Route(head_status=405, body=b"fine"), "ok"),
+    "/moved": (Route(status=301, headers={"Location": "/ok"}), "ok"),
+    "/linkedin": (Route(status=999), "blocked"),
+    "/rate-limited": (Route(status=429), "blocked"),
+    "/slow": (Route(delay=2.0, body=b"late"), "error"),
+}
+
+
+def main():
+    failures = []
+    linkcheck.READ_TIMEOUT = 0.5
+    routes = {path: route for path, (route, _) in ROUTES.items()}
+    routes.update({f"/many/{i}": Route(delay=SLOW_DELAY) for i in range(SLOW_ROUTES)})
+
+    with tempfile.TemporaryDirectory() as tmp_dir, StubServer(routes) as stub:
+        checker = linkcheck.Checker(os.path.join(tmp_dir, "linkcheck.json"))
+        urls = [stub.url(path) for path in routes]
+
+        start = time.perf_counter()
+        probed = checker.check(urls)
+        elapsed = time.perf_counter() - start
+        print(f"probed {probed} links in {elapsed:.2f} s (max in flight at one host: {stub.max_inflight})")
+        for path, (_, expected) in ROUTES.items():
+            result = checker.results[stub.url(path)]
+            ok = result.state == expected
+            print(f"  {path:14} {result.state:8} {result.status or '-':>4} {result.method:4} "
+                  f"{'ok' if ok else 'expected ' + expected}")
+            if not ok:
+                failures.append(f"{path}: {result.state} != {expected}")
+        if stub.max_inflight > linkcheck.PER_HOST:
+            failures.append(f"per-host limit exceeded: {stub.max_inflight} > {linkcheck.PER_HOST}")
+
+        requests_before = len(stub.requests)
+        reprobed = checker.check(urls)
+        print(f"within TTL: re-probed {reprobed}, requests {len(stub.requests) - requests_before}")
+        if reprobed or len(stub.requests) != requests_before:
+            failures.append("links re-probed within their TTL")
+        ttl, failed_ttl = linkcheck.TTL, linkcheck.FAILED_TTL
+        linkcheck.TTL = linkcheck.FAILED_TTL = 0
+        try:
+            reprobed = checker.check([stub.url("/ok"), stub.url("/missing")])
+        finally:
+            linkcheck.TTL, linkcheck.FAILED_TTL = ttl, failed_ttl
+        print(f"expired TTL: re-probed {reprobed}")
+        if reprobed != 2:
+            failures.append(f"expected 2 re-probes after TTL expiry, got {reprobed}")
+
+        # The UI side: compiled HTML marks dead links; status() never waits for a check.
+        linkcheck.checker = checker
+        html = render.link("Thesis", stub.url("/missing")) + render.link("Drive", stub.url("/ok"))
+        print(f"marked: {html.count('dead-link')} of 2 links")
+        if html.count("dead-link") != 1:
+            failures.append("dead link not marked (or live link marked)")
+
+        running = threading.Thread(target=checker.check, args=([stub.url("/slow")],), kwargs={"force": True})
+        running.start()
+        time.sleep(0.05)
+        start = time.perf_counter()
+        for _ in range(1000):
+            linkcheck.status(stub.url("/slow"))
+        read_us = (time.perf_counter() - start) * 1000
+        running.join()
+        print(f"status() during a running check: {read_us:.2f} us per call")
+        if read_us > 50:
+            failures.append(f"status() took {read_us:.1f} us")
+
+    print(f"content.json has {len(linkcheck.urls(content.load_content()))} external links to check")
+    if failures:
+        raise SystemExit("FAILED:\n  " + "\n  ".join(failures))
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Metrics: hot-path overhead, thread-safety of the sharded counters, and the
+series one visit to every section produces.
+
+1. ns per observe()/inc()/timer() with metrics enabled, and per timer()
+   with them disabled;
+2. 8 threads record concurrently, some exit before collection; every
+   observation must show up exactly once;
+3. haha.py under AppTest (sandboxed like suite.py) visits every section and
+   the exposition must contain the section, sidebar, script and fetch series.
+
+Usage:
+    python benchmarks/metrics_check.py
+"""
+import tempfile
+import threading
+import timeit
+
+from apptest_utils import app_test
+from stub_server import StubServer
+from suite import sandbox
+
+import metrics  # noqa: E402
+import sections  # noqa: E402
+import warmup  # noqa: E402
+
+THREADS = 8
+PER_THREAD = 20000
+
+
+def per_call_ns(stmt, number=200000):
+    return timeit.timeit(stmt, globals={"metrics": metrics}, number=number) / number * 1e9
+
+
+CALLS = {
+    "observe()": 'metrics.observe("bench_seconds", 0.003, section="home")',
+    "inc()": 'metrics.inc("bench_total", kind="error")',
+    "with timer()": 'with metrics.timer("bench_seconds"): pass',
+}
+
+
+def overhead():
+    for label, stmt in CALLS.items():
+        print(f"{label:22} {per_call_ns(stmt):7.0f} ns")
+    metrics.ENABLED = False
+    try:
+        print(f"{'with timer() disabled':22} {per_call_ns(CALLS['with timer()']):7.0f} ns")
+    finally:
+        metrics.ENABLED = True
+
+
+def threaded():
+    before = metrics.snapshot().get(("threaded_seconds", ()), [0] * (len(metrics.BUCKETS) + 2))
+    start = threading.Barrier(THREADS)
+
+    def work():
+        start.wait()
+        for i in range(PER_THREAD):
+            metrics.observe("threaded_seconds", (i % 100) / 1000)
+
+    threads = [threading.Thread(target=work) for _ in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads[: THREADS // 2]:
+        t.join()
+    metrics.snapshot()  # retires the finished threads' shards
+    for t in threads[THREADS // 2:]:
+        t.join()
+    series = metrics.snapshot()[("threaded_seconds", ())]
+    count = sum(series[:-1]) - sum(before[:-1])
+    expected = THREADS * PER_THREAD
+    print(f"threaded observations  {count} / {expected}  {'ok' if count == expected else 'MISMATCH'}")
+    return count == expected
+
+
+def app_series():
+    with tempfile.TemporaryDirectory() as tmp_dir, StubServer() as stub:
+        sandbox(stub, tmp_dir)
+        at = app_test({"PORTFOLIO_NAV": "radio"}, timeout=60)
+        at.run()
+        for title in sections.MENU:
+            at.sidebar.radio[0].set_value(title).run()
+            if at.exception:
+                raise RuntimeError(f"{title}: {at.exception}")
+        exposition = metrics.collect()
+        warmup.wait(120)  # the variant build runs in a subprocess; let it finish inside the sandbox
+        if stub.foreign_requests():
+            raise RuntimeError(f"requests left the sandbox: {stub.foreign_requests()}")
+    wanted = ['portfolio_script_run_seconds_count',
+              'portfolio_sidebar_render_seconds_count',
+              'portfolio_image_fetch_seconds_count{outcome="network"}',
+              'portfolio_image_cache_hits_total'] + \
+             [f'portfolio_section_render_seconds_count{{section="{slug}"}}' for slug in sections.MENU.values()]
+    missing = [w for w in wanted if w not in exposition]
+    for line in exposition.splitlines():
+        if line.startswith(tuple(w.split("{")[0] for w in wanted)) and "_bucket" not in line:
+            print(f"  {line}")
+    print(f"app series             {'ok' if not missing else 'missing: ' + ', '.join(missing)}")
+    return not missing
+
+
+if __name__ == "__main__":
+    overhead()
+    ok = threaded()
+    ok = app_series() and ok
+    raise SystemExit(0 if ok else 1)
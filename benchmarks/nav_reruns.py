@@ -0,0 +1,46 @@
+"""
+Server reruns and payload per navigation for each PORTFOLIO_NAV mode.
+
+A visitor opens the app and visits every section once
+(Home -> Work Samples -> Experience -> Home). In "radio" mode every click is a
+full script rerun; in "tabs" mode every section is sent with the first run
+and switching tabs never reaches the server.
+
+Usage:
+    python benchmarks/nav_reruns.py
+"""
+import time
+
+from apptest_utils import app_test, payload
+
+VISIT = ["Work Samples", "Experience", "Home"]
+
+
+def measure(mode):
+    at = app_test({"PORTFOLIO_NAV": mode})
+    start = time.perf_counter()
+    at.run()
+    runs, elements, html_bytes = 1, *payload(at)
+    if mode == "radio":
+        for section in VISIT:
+            at.sidebar.radio[0].set_value(section).run()
+            runs += 1
+            count, size = payload(at)
+            elements += count
+            html_bytes += size
+    assert not at.exception, at.exception
+    return {
+        "runs": runs,
+        "reruns_per_navigation": (runs - 1) / len(VISIT),
+        "elements_sent": elements,
+        "html_bytes_sent": html_bytes,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+if __name__ == "__main__":
+    print(f"{'mode':6} {'runs':>5} {'reruns/nav':>11} {'elements':>9} {'html bytes':>11} {'seconds':>8}")
+    for nav_mode in ("radio", "tabs"):
+        r = measure(nav_mode)
+        print(f"{nav_mode:6} {r['runs']:>5} {r['reruns_per_navigation']:>11.1f} {r['elements_sent']:>9} "
+              f"{r['html_bytes_sent']:>11} {r['seconds']:>8.2f}")
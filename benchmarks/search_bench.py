@@ -0,0 +1,76 @@
+"""
+Search index build time and query latency as the content grows.
+
+The real content.json is measured first, then synthetic content with
+thousands of entries: the real entries repeated with their words shuffled
+and mixed with made-up words, so the vocabulary grows along with the entry
+count. Query latency covers whole words, prefixes, multi-word queries and
+misses, including ranking and snippets.
+
+Usage:
+    python benchmarks/search_bench.py [--sizes 1000 5000 20000]
+"""
+import argparse
+import random
+import statistics
+import time
+
+import apptest_utils  # noqa: F401  (puts the app on sys.path)
+import content
+import search
+
+QUERIES = ("SPSS", "Leicester", "eSports", "leic", "social media", "premier league fans",
+           "mana", "gen z", "zzzz", "analysing trends")
+QUERY_ROUNDS = 200
+
+
+def synthetic_entries(base, size, seed=0):
+    rng = random.Random(seed)
+    vocabulary = sorted({word for entry in base for line in (entry.label,) + entry.lines
+                         for word in line.split()})
+    made_up = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10)))
+               for _ in range(size)]
+
+    def line(words):
+        return " ".join(rng.choice(vocabulary) if rng.random() < 0.8 else rng.choice(made_up) for _ in range(words))
+
+    entries = []
+    for number in range(size):
+        template = base[number % len(base)]
+        entries.append(search.Entry(template.section, template.expander, line(4),
+                                    tuple(line(rng.randint(8, 20)) for _ in range(len(template.lines) or 1))))
+    return entries
+
+
+def measure(entries):
+    start = time.perf_counter()
+    index = search.Index(entries)
+    build_ms = (time.perf_counter() - start) * 1000
+    latencies = []
+    for _ in range(QUERY_ROUNDS):
+        for query in QUERIES:
+            start = time.perf_counter()
+            index.search(query)
+            latencies.append((time.perf_counter() - start) * 1e6)
+    latencies.sort()
+    return {
+        "entries": len(entries),
+        "terms": len(index.terms),
+        "build_ms": build_ms,
+        "p50_us": statistics.median(latencies),
+        "p99_us": latencies[int(len(latencies) * 0.99)],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    args = parser.parse_args()
+
+    base = search.entries(content.load_content())
+    rows = [("content.json", measure(base))]
+    rows += [(f"synthetic {size}", measure(synthetic_entries(base, size))) for size in args.sizes]
+
+    print(f"{'content':18} {'entries':>8} {'terms':>8} {'build ms':>10} {'query p50 us':>13} {'query p99 us':>13}")
+    for name, r in rows:
+        print(f"{name:18} {r['entries']:>8} {r['terms']:>8} {r['build_ms']:>10.1f} {r['p50_us']:>13.1f} {r['p99_us']:>13.1f}")
@@ -0,0 +1,141 @@
+"""
+A local stand-in HTTP server for benchmarks and checks.
+
+Routes map a path to a ``Route`` (status, body, headers, delay, and an
+optional different status for HEAD). Unknown paths under ``/img/`` get a
+generated PNG with an ETag, so any remote image URL can be pointed at the
+stub. Conditional requests are honoured. ``max_inflight`` records the most
+requests that were being handled at once.
+
+``proxy_env()`` is an environment that sends every request not addressed to
+127.0.0.1 through the stub as a proxy. Those requests are refused and listed
+by ``foreign_requests()``, so a check can fail when something went out to
+the network (child processes included).
+
+    with StubServer() as stub:
+        url = stub.url("/img/linkedin.png")
+"""
+import hashlib
+import http.server
+import threading
+import time
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Optional
+
+
+@dataclass
+class Route:
+    status: int = 200
+    body: bytes = b""
+    headers: dict = field(default_factory=dict)
+    delay: float = 0.0  # seconds before responding
+    head_status: Optional[int] = None  # e.g. 405 for servers that refuse HEAD
+
+
+def png(seed, size=(96, 96)):
+    from PIL import Image, ImageDraw
+
+    digest = hashlib.sha256(seed.encode("utf-8")).digest()
+    img = Image.new("RGBA", size, (0, 0, 0, 0))
+    ImageDraw.Draw(img).rounded_rectangle((4, 4, size[0] - 4, size[1] - 4), 12, fill=(*digest[:3], 255))
+    out = BytesIO()
+    img.save(out, format="PNG")
+    return out.getvalue()
+
+
+class StubServer:
+    def __init__(self, routes=None):
+        self.routes = dict(routes or {})
+        self.requests = []  # (method, path, headers)
+        self.inflight = 0
+        self.max_inflight = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self._server.server_port}{path}"
+
+    def proxy_env(self):
+        proxy = f"http://127.0.0.1:{self._server.server_port}"
+        return {"HTTP_PROXY": proxy, "HTTPS_PROXY": proxy, "http_proxy": proxy, "https_proxy": proxy,
+                "NO_PROXY": "127.0.0.1,localhost", "no_proxy": "127.0.0.1,localhost"}
+
+    def foreign_requests(self):
+        """Requests meant for another host: absolute-URL proxy requests and CONNECT tunnels."""
+        with self._lock:
+            return [(method, path) for method, path, _ in self.requests
+                    if method == "CONNECT" or not path.startswith("/")]
+
+    def route_for(self, path):
+        with self._lock:
+            route = self.routes.get(path)
+            if route is None and path.startswith("/img/"):
+                body = png(path)
+                route = Route(body=body, headers={"Content-Type": "image/png",
+                                                  "ETag": '"%s"' % hashlib.sha1(body).hexdigest()})
+                self.routes[path] = route
+            return route
+
+    def __enter__(self):
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self, send_body):
+                with stub._lock:
+                    stub.requests.append((self.command, self.path, dict(self.headers)))
+                    stub.inflight += 1
+                    stub.max_inflight = max(stub.max_inflight, stub.inflight)
+                try:
+                    self._send(send_body)
+                finally:
+                    with stub._lock:
+                        stub.inflight -= 1
+
+            def _send(self, send_body):
+                route = stub.route_for(self.path) or Route(status=404, body=b"not found")
+                if route.delay:
+                    time.sleep(route.delay)
+                etag = route.headers.get("ETag")
+                if etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                status = route.head_status if (self.command == "HEAD" and route.head_status) else route.status
+                self.send_response(status)
+                for name, value in route.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(route.body)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(route.body)
+
+            def do_GET(self):
+                self._respond(True)
+
+            def do_HEAD(self):
+                self._respond(False)
+
+            def do_CONNECT(self):
+                with stub._lock:
+                    stub.requests.append((self.command, self.path, dict(self.headers)))
+                self.send_response(403)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                self.close_connection = True
+
+            def log_message(self, *args):
+                pass
+
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
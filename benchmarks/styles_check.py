@@ -0,0 +1,65 @@
+"""
+Pruned stylesheet vs. rendered markup: no rule the app needs is pruned.
+
+Renders every section with AppTest (tabs mode, so one run shows all of them)
+and builds the static export, collects every class and id in their HTML, and
+checks that each one styles.css has rules for is still in the pruned sheet.
+The pruner (styles.py) finds our names by reading the source, so a new way
+of emitting a class that it does not recognise shows up here.
+
+Usage:
+    python benchmarks/styles_check.py
+"""
+import sys
+import tempfile
+from html.parser import HTMLParser
+
+from apptest_utils import app_test, walk
+
+import export  # noqa: E402
+import styles  # noqa: E402
+
+
+class NameCollector(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.names = set()
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name in ("class", "id") and value:
+                self.names.update(value.split())
+
+
+def names_in(html):
+    parser = NameCollector()
+    parser.feed(html)
+    return parser.names
+
+
+def names_in_rules(css):
+    return {name for selectors, _ in styles.parse_rules(css) for s in selectors for name in styles._own_names(s)}
+
+
+if __name__ == "__main__":
+    at = app_test({"PORTFOLIO_NAV": "tabs"})
+    at.run()
+    if at.exception:
+        sys.exit(f"app raised: {at.exception}")
+    rendered = set()
+    for node in walk(at._tree):
+        if getattr(node, "type", None) in ("markdown", "html"):
+            rendered |= names_in(node.proto.body)
+    with tempfile.TemporaryDirectory() as out_dir:
+        with open(export.export(out_dir), encoding="utf-8") as f:
+            rendered |= names_in(f.read())
+
+    with open(styles.CSS_PATH, encoding="utf-8") as f:
+        styled = names_in_rules(styles.minify(f.read()))
+    kept = names_in_rules(styles.stylesheet()["css"])
+    needed = sorted(rendered & styled)
+    pruned = [name for name in needed if name not in kept]
+    for name in pruned:
+        print(f"rendered but its rules were pruned: {name}")
+    print(f"{len(needed) - len(pruned)}/{len(needed)} rendered classes/ids with rules in styles.css keep them")
+    sys.exit(1 if pruned else 0)
@@ -0,0 +1,207 @@
+"""
+Rerun performance suite with regression gates.
+
+Runs haha.py under AppTest for every menu section (radio navigation, so each
+run renders exactly one section) and for Home with a cold image cache. All
+images - icons and a profile picture - are served by a local stub server and
+all caches live in a temp directory, so results do not depend on the network.
+The sandbox is passed on through the environment too, so the processes the
+app starts (the variant build) use it as well. Any request to another host
+goes to the stub as a proxy request and fails the run.
+
+Per scenario it records:
+    wall_ms         median script run time
+    peak_kb         peak Python memory during one run (tracemalloc)
+    elements        elements/blocks emitted by the run
+    html_bytes      markdown/HTML payload of the run
+
+Usage:
+    python benchmarks/suite.py run [-o results.json] [--runs 15]
+    python benchmarks/suite.py compare results.json benchmarks/baseline.json
+    python benchmarks/suite.py run -o benchmarks/baseline.json   # re-record baseline
+
+``compare`` exits non-zero when any metric regresses beyond its threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from apptest_utils import APP_DIR, app_test, payload
+from stub_server import Route, StubServer, png
+
+import analytics  # noqa: E402
+import assets  # noqa: E402
+import content  # noqa: E402
+import documents  # noqa: E402
+import fetch  # noqa: E402
+import linkcheck  # noqa: E402
+import metrics  # noqa: E402
+import sections  # noqa: E402
+import styles  # noqa: E402
+import variants  # noqa: E402
+import warmup  # noqa: E402
+
+TIME_METRICS = ("wall_ms",)
+METRICS = ("wall_ms", "peak_kb", "elements", "html_bytes")
+
+
+# --- Sandbox ---
+def sandbox(stub, tmp_dir):
+    """
+    Points content, icon/variant output and the HTTP caches at temp files +
+    the stub: module attributes for this process, the environment for its
+    children.
+    """
+    with open(os.path.join(APP_DIR, "content.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    for item in data["links"] + data["skills"]:
+        item["icon_url"] = stub.url(f"/img/{item['icon']}.png")
+    stub.routes["/img/profile.jpg"] = Route(body=png("profile", (800, 800)), headers={"Content-Type": "image/png"})
+    data["profile"]["image"] = stub.url("/img/profile.jpg")
+    content_path = os.path.join(tmp_dir, "content.json")
+    with open(content_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    content.CONTENT_PATH = content_path
+
+    static_dir = os.path.join(tmp_dir, "static")
+    cache_dir = os.path.join(tmp_dir, "cache")
+    os.environ.update(stub.proxy_env(), PORTFOLIO_CONTENT=content_path, PORTFOLIO_STATIC_DIR=static_dir,
+                      PORTFOLIO_CACHE_DIR=cache_dir, PORTFOLIO_LINKCHECK="0",
+                      PORTFOLIO_METRICS_FILE=os.path.join(cache_dir, "metrics.prom"))
+    assets.STATIC_DIR = static_dir
+    assets.ICON_DIR = os.path.join(static_dir, "icons")
+    assets.MANIFEST_PATH = os.path.join(assets.ICON_DIR, "manifest.json")
+    variants.VARIANT_DIR = os.path.join(static_dir, "variants")
+    variants.MANIFEST_PATH = os.path.join(variants.VARIANT_DIR, "manifest.json")
+    variants._manifest = None
+    documents.DOC_DIR = os.path.join(static_dir, "files")
+    documents.MANIFEST_PATH = os.path.join(documents.DOC_DIR, "manifest.json")
+    documents._manifest = None
+    styles.CSS_DIR = os.path.join(static_dir, "css")
+    styles.CACHE_DIR = cache_dir
+    linkcheck.checker = linkcheck.Checker(os.path.join(cache_dir, "linkcheck.json"))
+    analytics.DB_PATH = os.path.join(cache_dir, "analytics.sqlite3")
+    metrics.METRICS_FILE = os.environ["PORTFOLIO_METRICS_FILE"]
+    reset_image_caches(tmp_dir)
+
+
+def reset_image_caches(tmp_dir):
+    fetch.image_cache = fetch.ImageLRU()
+    fetch.disk_cache = fetch.DiskCache(tempfile.mkdtemp(dir=tmp_dir))
+
+
+# --- Measuring ---
+def measure(at, section, runs, before_run=None):
+    def one_run():
+        if before_run:
+            before_run()
+        at.sidebar.radio[0].set_value(section).run()
+        if at.exception:
+            raise RuntimeError(f"{section}: {at.exception}")
+
+    one_run()  # settle: first visit imports the section module
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        one_run()
+        times.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    one_run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    elements, html_bytes = payload(at)
+    return {"wall_ms": round(statistics.median(times), 3), "peak_kb": round(peak / 1024, 1),
+            "elements": elements, "html_bytes": html_bytes}
+
+
+def run_suite(runs):
+    with tempfile.TemporaryDirectory() as tmp_dir, StubServer() as stub:
+        sandbox(stub, tmp_dir)
+        at = app_test({"PORTFOLIO_NAV": "radio"}, timeout=60)
+        at.run()
+        # Let the background warm-up (icons, and the variant build it runs in a
+        # subprocess) land so every scenario sees the same markup.
+        warmup.wait(120)
+        missing = sorted(set(assets.icons()) - set(variants.load_manifest()))
+        if missing:
+            raise SystemExit(f"warm-up did not build the variants of {missing}")
+
+        scenarios = {}
+        for title in sections.MENU:
+            scenarios[sections.MENU[title]] = measure(at, title, runs)
+        scenarios["home_cold_image_cache"] = measure(
+            at, "Home", runs, before_run=lambda: reset_image_caches(tmp_dir))
+        stub_requests = len(stub.requests)
+        foreign = stub.foreign_requests()
+        if foreign:
+            raise SystemExit("requests left the sandbox:\n  " + "\n  ".join(f"{m} {p}" for m, p in foreign))
+
+    import streamlit
+    return {
+        "environment": {"python": platform.python_version(), "streamlit": streamlit.__version__,
+                        "machine": platform.machine(), "runs": runs, "stub_requests": stub_requests},
+        "scenarios": scenarios,
+    }
+
+
+# --- Comparing ---
+def compare(current, baseline, threshold, time_threshold):
+    """Returns a list of regression messages (empty when everything is within bounds)."""
+    regressions = []
+    for name, base in baseline["scenarios"].items():
+        now = current["scenarios"].get(name)
+        if now is None:
+            regressions.append(f"{name}: scenario missing from results")
+            continue
+        for metric in METRICS:
+            if metric not in base:
+                continue
+            limit = time_threshold if metric in TIME_METRICS else threshold
+            allowed = base[metric] * (1 + limit)
+            status = "REGRESSED" if now[metric] > allowed else "ok"
+            print(f"{name:24} {metric:11} {base[metric]:>12} -> {now[metric]:>12}  (limit +{limit:.0%})  {status}")
+            if now[metric] > allowed:
+                regressions.append(f"{name}.{metric}: {base[metric]} -> {now[metric]}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_parser = sub.add_parser("run")
+    run_parser.add_argument("-o", "--output", default="bench_results.json")
+    run_parser.add_argument("--runs", type=int, default=15)
+    compare_parser = sub.add_parser("compare")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="allowed relative increase for memory/elements/bytes")
+    compare_parser.add_argument("--time-threshold", type=float, default=0.50,
+                                help="allowed relative increase for wall time (noisier)")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_suite(args.runs)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        for scenario, metrics in results["scenarios"].items():
+            print(f"{scenario:24} " + "  ".join(f"{m}={metrics[m]}" for m in METRICS))
+        print(f"wrote {args.output}")
+    else:
+        with open(args.current) as f:
+            current_results = json.load(f)
+        with open(args.baseline) as f:
+            baseline_results = json.load(f)
+        failures = compare(current_results, baseline_results, args.threshold, args.time_threshold)
+        if failures:
+            sys.exit("performance regressions:\n  " + "\n  ".join(failures))
+        print("no regressions")
@@ -0,0 +1,188 @@
+"""
+Multi-tenant load test: hundreds of synthetic portfolios in one process.
+
+Writes ``--tenants`` synthetic portfolios into a temp tenant directory. Their
+sizes vary (1-4x the real content) and every third one has a theme. Then it
+drives haha.py under AppTest from ``--sessions`` concurrent-style sessions
+(radio navigation, random section per request), in two phases:
+
+1. cold: every tenant is visited once, filling the shared cache past its
+   budget so evictions start;
+2. steady: ``--requests`` visits with Zipf-distributed tenant popularity
+   (a few busy portfolios, a long tail), as a shared host would see.
+
+Reports p50/p95 rerun latency per phase, the process RSS along the way and
+the shared cache's bytes, tenants and evictions, and checks:
+- every run shows the requested tenant's name (no cross-tenant leaks);
+- the cache stays within its byte budget and every tenant within its quota;
+- memory plateaus: RSS grows by less than ``MAX_PLATEAU_GROWTH_MB`` over the
+  second half of the steady phase, once the cache has reached its budget;
+- an unknown ``?tenant=`` gets an error, not someone else's portfolio.
+
+glibc reads ``MALLOC_ARENA_MAX`` at process start, so unless it is already
+set the script re-executes itself with the value deployments use (2, see
+settings.py); the plateau check is about that configuration.
+
+Usage:
+    python benchmarks/tenant_load.py [--tenants 400] [--requests 2000] [--cache-mb 16]
+"""
+import argparse
+import copy
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from apptest_utils import app_test
+
+import content  # noqa: E402
+import lru  # noqa: E402
+import sections  # noqa: E402
+import tenants  # noqa: E402
+
+MAX_PLATEAU_GROWTH_MB = 16
+MALLOC_ARENA_MAX = "2"
+THEME = {"page_title": "Portfolio", "heading": "#1d3557", "accent": "#e63946", "sidebar": "#14213d"}
+
+
+def make_tenants(root, count, seed=0):
+    """Writes ``count`` portfolios derived from content.json; returns ``slug -> profile name``."""
+    with open(content.CONTENT_PATH, encoding="utf-8") as f:
+        base = json.load(f)
+    base.pop("documents", None)
+    rng = random.Random(seed)
+    names = {}
+    for i in range(count):
+        slug = f"tenant-{i:04d}"
+        data = copy.deepcopy(base)
+        data["profile"]["name"] = names[slug] = f"Person {i:04d}"
+        data["profile"]["bio"] = f"{data['profile']['bio']} Portfolio number {i}."
+        repeat = rng.choice((1, 1, 2, 4))
+        data["projects"] = [dict(p, title=f"{p['title']} #{r} ({slug})")
+                            for r in range(repeat) for p in base["projects"]]
+        for group in data["experience"]:
+            group["jobs"] = [dict(job, bullets=job["bullets"] + [f"Worked on {slug} deliverable {r}."])
+                             for r in range(repeat) for job in group["jobs"]]
+        os.makedirs(os.path.join(root, slug))
+        with open(os.path.join(root, slug, "content.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        if i % 3 == 0:
+            with open(os.path.join(root, slug, "theme.json"), "w", encoding="utf-8") as f:
+                json.dump(dict(THEME, page_title=f"{names[slug]} - Portfolio"), f)
+    return names
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def visit(at, slug, section):
+    at.query_params["tenant"] = slug
+    at.sidebar.radio[0].set_value(section)
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(f"{slug}/{section}: {at.exception}")
+    return elapsed
+
+
+def shows(at, name):
+    return any(name in (m.value or "") for m in at.markdown)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tenants", type=int, default=400)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--cache-mb", type=float, default=16,
+                        help="shared cache budget for the run (the app default is "
+                             f"{lru.SHARED_CACHE_BYTES // 2 ** 20} MB)")
+    args = parser.parse_args()
+    if "MALLOC_ARENA_MAX" not in os.environ:
+        os.execve(sys.executable, [sys.executable] + sys.argv, dict(os.environ, MALLOC_ARENA_MAX=MALLOC_ARENA_MAX))
+    print(f"MALLOC_ARENA_MAX={os.environ['MALLOC_ARENA_MAX']}")
+
+    failures = []
+    rng = random.Random(1)
+    menu = list(sections.MENU)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        names = make_tenants(tmp_dir, args.tenants)
+        slugs = sorted(names)
+        tenants.TENANT_DIR = tmp_dir
+        lru.shared = lru.QuotaLRU(int(args.cache_mb * 2 ** 20), lru.OWNER_QUOTA_BYTES)
+        sessions = [app_test({"PORTFOLIO_NAV": "radio"}, timeout=60) for _ in range(args.sessions)]
+        for at in sessions:
+            at.run()
+        rss_start = rss_mb()
+
+        def check(at, slug):
+            if not shows(at, names[slug]):
+                failures.append(f"{slug}: page does not show {names[slug]}")
+
+        cold = []
+        for i, slug in enumerate(slugs):
+            at = sessions[i % len(sessions)]
+            cold.append(visit(at, slug, menu[0]))
+            check(at, slug)
+        rss_cold = rss_mb()
+
+        weights = [1 / (rank + 1) ** 1.1 for rank in range(len(slugs))]
+        popular = slugs[:]
+        rng.shuffle(popular)
+        steady = []
+        rss_half = None
+        for i in range(args.requests):
+            if i == args.requests // 2:
+                rss_half = rss_mb()
+            slug = rng.choices(popular, weights)[0]
+            at = sessions[rng.randrange(len(sessions))]
+            section = rng.choice(menu)
+            steady.append(visit(at, slug, section))
+            if section == menu[0]:
+                check(at, slug)
+        rss_steady = rss_mb()
+
+        at = sessions[0]
+        at.query_params["tenant"] = "no-such-tenant"
+        at.run()
+        if not at.error or any(shows(at, name) for name in list(names.values())[:5]):
+            failures.append("unknown tenant did not get an error page")
+
+        stats = lru.shared.stats()
+        quota_ok = all(lru.shared.owner_bytes(slug) <= stats["owner_max_bytes"] for slug in slugs)
+
+    print(f"{args.tenants} tenants, {args.sessions} sessions, shared cache {args.cache_mb:g} MB "
+          f"(quota {stats['owner_max_bytes'] / 2 ** 20:g} MB per tenant)")
+    for phase, times in (("cold", cold), ("steady", steady)):
+        print(f"  {phase:6} {len(times):5} runs  p50 {statistics.median(times):6.1f} ms  "
+              f"p95 {percentile(times, 0.95):6.1f} ms  max {max(times):6.1f} ms")
+    print(f"  RSS start {rss_start:.0f} MB, after cold {rss_cold:.0f} MB, "
+          f"mid-steady {rss_half:.0f} MB, end {rss_steady:.0f} MB (+{rss_steady - rss_half:.0f} over the second half)")
+    print(f"  cache {stats['bytes'] / 2 ** 20:.1f}/{stats['max_bytes'] / 2 ** 20:g} MB, "
+          f"{stats['owners']} tenants cached, {stats['entries']} entries, "
+          f"hits {stats['hits']}, misses {stats['misses']}, evictions {stats['evictions']}")
+
+    if stats["bytes"] > stats["max_bytes"]:
+        failures.append("shared cache over its byte budget")
+    if not quota_ok:
+        failures.append("a tenant exceeded its quota")
+    if rss_steady - rss_half > MAX_PLATEAU_GROWTH_MB:
+        failures.append(f"RSS still grew {rss_steady - rss_half:.0f} MB over the second half of the steady phase")
+    if failures:
+        raise SystemExit("FAILED:\n  " + "\n  ".join(failures[:20]))
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Bytes shipped and encode time: the single-size PNG path of
+load_and_resize_image vs. the WebP/PNG variants from variants.py.
+
+Usage:
+    python benchmarks/variants_bench.py [--offline fixtures/icons] [--repeat 5]
+
+Without --offline a synthetic photo and icon are used so it runs anywhere.
+"""
+import argparse
+import os
+import sys
+import time
+from io import BytesIO
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import assets  # noqa: E402
+import variants  # noqa: E402
+
+
+def synthetic_sources():
+    photo = Image.effect_mandelbrot((1200, 800), (-2.0, -1.0, 1.0, 1.0), 80).convert("RGB")
+    photo = Image.merge("RGB", (photo.getchannel(0), photo.rotate(3).getchannel(0), Image.linear_gradient("L").resize(photo.size)))
+    icon = Image.new("RGBA", (96, 96), (0, 0, 0, 0))
+    ImageDraw.Draw(icon).rounded_rectangle((8, 8, 88, 88), 16, fill=(33, 115, 70, 255))
+    sources = {}
+    for name, img, fmt, width in (("photo", photo, "JPEG", 250), ("icon", icon, "PNG", assets.SKILL_ICON_WIDTH)):
+        out = BytesIO()
+        img.save(out, format=fmt)
+        sources[name] = (out.getvalue(), width)
+    return sources
+
+
+def offline_sources(directory):
+    sources = {}
+    for name, (url, width) in assets.ICONS.items():
+        sources[name] = (assets.fetch_source(name, url, directory), width)
+    return sources
+
+
+def current_path(data, width):
+    """What load_and_resize_image did before: default resize, plain PNG."""
+    img = Image.open(BytesIO(data))
+    img = img.resize((width, int(img.height * (width / img.width))))
+    out = BytesIO()
+    img.save(out, format="PNG")
+    return len(out.getvalue())
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--offline", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sources = offline_sources(args.offline) if args.offline else synthetic_sources()
+
+    print(f"{'image':10} {'current PNG 1x':>16} {'webp 1x':>9} {'webp 2x':>9} {'png 1x':>9} {'cur ms':>8} {'var ms':>8}")
+    totals = [0, 0]
+    for name, (data, width) in sources.items():
+        current_bytes, current_ms = timed(lambda: current_path(data, width), args.repeat)
+        (entry, _), variant_ms = timed(lambda: variants.encode_variants(name, data, width), args.repeat)
+        webp = {v["density"]: v["bytes"] for v in entry["sources"]["webp"]}
+        png_1x = entry["sources"]["png"][0]["bytes"]
+        totals[0] += current_bytes
+        totals[1] += webp[min(webp)]
+        print(f"{name:10} {current_bytes:>14} B {webp[min(webp)]:>7} B {webp.get(2, 0):>7} B {png_1x:>7} B "
+              f"{current_ms:>8.1f} {variant_ms:>8.1f}")
+    print(f"\n1x bytes shipped to WebP-capable browsers: {totals[1]} B vs {totals[0]} B "
+          f"({100 * (1 - totals[1] / totals[0]):.0f}% smaller)")
+    print("var ms covers every density and format; it runs once at startup in the process pool.")
@@ -0,0 +1,195 @@
+"""
+Portfolio content model.
+
+All text, links and icons live in ``content.json``; this module turns that
+file into typed, read-only objects. Video engagement counts are numbers
+(legacy "4.6 Million"-style text is converted) and ``{video_views}``-style
+placeholders in bullets are filled with their totals (engagement.py).
+``load_content`` keeps the parsed result in memory and only re-reads the file
+when its mtime changes, so edits show up on the next rerun without restarting
+the app.
+"""
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import engagement
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTENT_PATH = os.environ.get("PORTFOLIO_CONTENT", os.path.join(APP_DIR, "content.json"))
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    headline: str
+    bio: str
+    footer: str
+    image: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Link:
+    """A sidebar link or a skill: an icon that points somewhere."""
+    name: str
+    url: str
+    icon: str
+    icon_url: str
+
+
+@dataclass(frozen=True)
+class Project:
+    title: str
+    url: str
+    bullets: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class VideoEdit:
+    title: str
+    url: str
+    views: int
+    reactions: int
+    comments: int
+
+
+@dataclass(frozen=True)
+class SocialAccount:
+    name: str
+    url: str
+
+
+@dataclass(frozen=True)
+class Job:
+    company: str
+    role: str
+    bullets: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class JobGroup:
+    title: str
+    jobs: Tuple[Job, ...] = ()
+
+
+@dataclass(frozen=True)
+class Education:
+    degree: str
+    school: str
+    dates: str
+    bullets: Tuple[str, ...] = ()
+
+    @property
+    def title(self):
+        return f"{self.degree} | {self.school}"
+
+
+@dataclass(frozen=True)
+class Document:
+    """A file served by the app itself (see documents.py) in place of ``url``."""
+    name: str
+    title: str
+    file: str   # relative to the content file
+    url: str
+
+
+@dataclass(frozen=True)
+class Content:
+    profile: Profile
+    links: Tuple[Link, ...] = ()
+    skills: Tuple[Link, ...] = ()
+    projects: Tuple[Project, ...] = ()
+    video_edits: Tuple[VideoEdit, ...] = ()
+    social_accounts: Tuple[SocialAccount, ...] = ()
+    podcasts: Tuple[Project, ...] = ()
+    experience: Tuple[JobGroup, ...] = ()
+    education: Tuple[Education, ...] = ()
+    documents: Tuple[Document, ...] = ()
+    hash: str = field(default="", compare=False)
+    tenant: str = field(default="", compare=False)  # slug in multi-tenant mode (tenants.py)
+
+
+def _items(cls, rows, fill=None):
+    items = []
+    for row in rows or []:
+        row = dict(row)
+        if "bullets" in row:
+            row["bullets"] = tuple(map(fill, row["bullets"]) if fill else row["bullets"])
+        items.append(cls(**row))
+    return tuple(items)
+
+
+def _video_edit(row):
+    row = dict(row)
+    for name in engagement.FIELDS:
+        row[name] = engagement.parse_count(row[name])
+    return VideoEdit(**row)
+
+
+def parse_content(data, digest="", tenant=""):
+    """Builds a ``Content`` object from the decoded JSON document."""
+    video_edits = tuple(_video_edit(row) for row in data.get("video_edits") or [])
+    totals = engagement.summarise(video_edits).totals
+
+    def fill(text):
+        return engagement.fill_totals(text, totals)
+
+    return Content(
+        profile=Profile(**data["profile"]),
+        links=_items(Link, data.get("links")),
+        skills=_items(Link, data.get("skills")),
+        projects=_items(Project, data.get("projects"), fill),
+        video_edits=video_edits,
+        social_accounts=_items(SocialAccount, data.get("social_accounts")),
+        podcasts=_items(Project, data.get("podcasts"), fill),
+        experience=tuple(
+            JobGroup(title=group["title"], jobs=_items(Job, group.get("jobs"), fill))
+            for group in data.get("experience", [])
+        ),
+        education=_items(Education, data.get("education"), fill),
+        documents=_items(Document, data.get("documents")),
+        hash=digest,
+        tenant=tenant,
+    )
+
+
+# --- Loading (memoised on mtime) ---
+def read_content(path, tenant=""):
+    """Reads and parses ``path`` without any caching."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return parse_content(json.loads(raw), hashlib.sha256(raw).hexdigest(), tenant)
+
+
+_loaded = {}
+_load_lock = threading.Lock()
+
+
+def load_content(path=None):
+    """
+    Returns the parsed content for ``path`` (default: ``CONTENT_PATH``). The
+    file is only re-read and re-parsed when its mtime changes; otherwise this
+    is a stat and a dict lookup.
+    """
+    path = path or CONTENT_PATH
+    mtime = os.path.getmtime(path)
+    cached = _loaded.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with _load_lock:
+        cached = _loaded.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        parsed = read_content(path)
+        _loaded[path] = (mtime, parsed)
+        return parsed
+
+
+def icon_registry(site):
+    """``name -> (source url, kind)`` for every icon the content uses."""
+    icons = {link.icon: (link.icon_url, "sidebar") for link in site.links}
+    icons.update({skill.icon: (skill.icon_url, "skill") for skill in site.skills})
+    return icons
@@ -0,0 +1,195 @@
+"""
+Locally served documents (resume, thesis) instead of Google Drive viewer pages.
+
+content.json lists each document with its source file (relative to the
+content file, e.g. ``files/resume.pdf``) and the Drive URL it replaces.
+``publish()`` copies every source to ``static/files/<name>.<hash>.pdf``.
+Streamlit's static route serves these files: it streams them from disk in
+chunks, answers HTTP range requests (206) and sends ETag/Last-Modified. No
+session ever holds the bytes, so memory stays flat however many downloads
+run at once. The content hash in the file name lets a CDN or reverse proxy
+cache ``/app/static/files/*`` as ``immutable``, as with the icons.
+
+``href(url)`` turns a Drive URL into the local path once the document is
+published. Until then, or if its source file is missing, the link keeps
+pointing at Drive.
+
+With PyMuPDF installed (optional), the first page of each document is also
+rendered to a PNG preview, once per document hash.
+
+Usage:
+    python documents.py publish
+"""
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+
+import assets
+import content
+
+DOC_DIR = os.path.join(assets.STATIC_DIR, "files")
+MANIFEST_PATH = os.path.join(DOC_DIR, "manifest.json")
+STATIC_URL = "app/static/files"
+PREVIEW_WIDTH = 240
+CHUNK_BYTES = 1 << 20
+
+_manifest = None
+_by_url = {}
+_version = 0
+_lock = threading.Lock()
+
+
+def source_path(document):
+    return os.path.join(os.path.dirname(os.path.abspath(content.CONTENT_PATH)), document.file)
+
+
+def file_digest(path):
+    """sha256 of a file, read in chunks so large PDFs never sit in memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def render_preview(path, width=PREVIEW_WIDTH):
+    """PNG bytes and size of the first page, or None without PyMuPDF (optional dependency)."""
+    try:
+        import pymupdf
+    except ImportError:
+        return None
+    with pymupdf.open(path) as pdf:
+        page = pdf[0]
+        zoom = width / page.rect.width
+        pixmap = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom))
+        return pixmap.tobytes("png"), (pixmap.width, pixmap.height)
+
+
+def _copy(src, file_name):
+    """
+    Writes a copy of ``src`` into DOC_DIR as ``file_name``. Never a hard link:
+    editing ``files/`` in place would then change a file served as immutable.
+    """
+    path = os.path.join(DOC_DIR, file_name)
+    if os.path.exists(path):
+        return
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _publish_one(document, previous):
+    src = source_path(document)
+    stat = os.stat(src)
+    os.makedirs(DOC_DIR, exist_ok=True)
+    if (previous and previous["source_size"] == stat.st_size and previous["source_mtime"] == stat.st_mtime_ns
+            and os.path.exists(os.path.join(DOC_DIR, previous["file"]))):
+        return previous  # unchanged since the last publish: no re-hash
+    digest = file_digest(src)[:12]
+    ext = os.path.splitext(src)[1].lower() or ".pdf"
+    entry = {"file": f"{document.name}.{digest}{ext}", "source_url": document.url, "title": document.title,
+             "bytes": stat.st_size, "source_size": stat.st_size, "source_mtime": stat.st_mtime_ns,
+             "preview": None}
+    _copy(src, entry["file"])
+    if previous and previous.get("preview") and previous["file"] == entry["file"]:
+        entry["preview"] = previous["preview"]
+    else:
+        try:
+            preview = render_preview(src)
+        except Exception as e:  # a broken PDF still gets served, just without a preview
+            print(f"Preview failed for {document.name}: {e}", file=sys.stderr)
+            preview = None
+        if preview:
+            png, (w, h) = preview
+            file_name = f"{document.name}.{digest}.preview.png"
+            with open(os.path.join(DOC_DIR, file_name), "wb") as f:
+                f.write(png)
+            entry["preview"] = {"file": file_name, "width": w, "height": h}
+    return entry
+
+
+def publish(site=None):
+    """
+    Publishes every document whose source file exists and writes the
+    manifest. Stale files from earlier versions are removed.
+    """
+    global _manifest, _by_url, _version
+    site = site or content.load_content()
+    previous = load_manifest()
+    manifest = {}
+    for document in site.documents:
+        try:
+            manifest[document.name] = _publish_one(document, previous.get(document.name))
+        except FileNotFoundError:
+            print(f"Document source missing, linking to {document.url}: {source_path(document)}",
+                  file=sys.stderr)
+    if not os.path.isdir(DOC_DIR):
+        return manifest
+
+    keep = {entry["file"] for entry in manifest.values()}
+    keep |= {entry["preview"]["file"] for entry in manifest.values() if entry["preview"]}
+    for file_name in os.listdir(DOC_DIR):
+        if file_name not in keep and file_name != "manifest.json":
+            os.remove(os.path.join(DOC_DIR, file_name))
+
+    if manifest != previous:
+        tmp_path = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, MANIFEST_PATH)
+        with _lock:
+            _manifest, _by_url = manifest, _index(manifest)
+            _version += 1
+    return manifest
+
+
+# --- Lookup ---
+def _index(manifest):
+    return {entry["source_url"]: entry for entry in manifest.values()}
+
+
+def load_manifest():
+    global _manifest, _by_url
+    if _manifest is None:
+        with _lock:
+            if _manifest is None:
+                try:
+                    with open(MANIFEST_PATH) as f:
+                        manifest = json.load(f)
+                except (OSError, ValueError):
+                    manifest = {}
+                _manifest, _by_url = manifest, _index(manifest)
+    return _manifest
+
+
+def version():
+    """Bumped whenever a document is (re)published, so callers can key caches on it."""
+    return _version
+
+
+def href(url):
+    """The local path serving ``url``'s document, or ``url`` itself if there is none."""
+    load_manifest()
+    entry = _by_url.get(url)
+    return f"{STATIC_URL}/{entry['file']}" if entry else url
+
+
+def preview(url):
+    """``(src, width, height)`` of the first-page preview of ``url``'s document, or None."""
+    load_manifest()
+    entry = _by_url.get(url)
+    if not entry or not entry["preview"]:
+        return None
+    p = entry["preview"]
+    return f"{STATIC_URL}/{p['file']}", p["width"], p["height"]
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["publish"]:
+        sys.exit("usage: python documents.py publish")
+    for doc_name, doc in sorted(publish().items()):
+        print(f"{doc_name:8} {doc['bytes']:>9} B  {doc['file']}"
+              + (f"  preview {doc['preview']['file']}" if doc["preview"] else ""))
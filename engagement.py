@@ -0,0 +1,106 @@
+"""
+Video engagement figures: numbers in content.json, text on the page.
+
+Each video edit's views, reactions and comments are stored as integers.
+``parse_count`` also reads the free-text notation content files used before
+("4.6 Million", "155k", "3.4k", "597"), so an older content.json or tenant
+file still loads unchanged; ``format_count`` writes a number back in that
+notation for display.
+
+Totals are derived rather than typed by hand: a bullet may say
+``{video_views}``, ``{video_reactions}`` or ``{video_comments}``, and
+content.py fills in the sum over every video edit (``fill_totals``).
+``summarise`` computes the totals and the per-edit chart figures in one
+vectorised NumPy pass. It runs when content is parsed and when render.py
+compiles the Video Edits chart, i.e. once per content hash, never per rerun.
+
+Usage:
+    python engagement.py     # the current content's per-edit figures and totals
+"""
+import re
+from dataclasses import dataclass
+from typing import Tuple
+
+FIELDS = ("views", "reactions", "comments")
+UNITS = {"": 1, "k": 10 ** 3, "thousand": 10 ** 3, "m": 10 ** 6, "million": 10 ** 6,
+         "b": 10 ** 9, "billion": 10 ** 9}
+
+_COUNT = re.compile(r"([0-9][0-9,]*(?:\.[0-9]+)?)\s*([a-z]*)", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Summary:
+    totals: Tuple[int, ...]           # views, reactions, comments over every edit
+    widths: Tuple[float, ...] = ()    # each edit's views as a percentage of the most viewed
+    rates: Tuple[float, ...] = ()     # (reactions + comments) / views, per edit
+
+
+def parse_count(value):
+    """An engagement count as an int: 597, "597", "3.4k", "4.6 Million", "1,234"."""
+    if isinstance(value, bool):
+        raise ValueError(f"not a count: {value!r}")
+    if isinstance(value, (int, float)):
+        return int(round(value))
+    match = _COUNT.fullmatch(str(value).strip())
+    unit = match and UNITS.get(match.group(2).lower())
+    if not unit:
+        raise ValueError(f"not a count: {value!r}")
+    return int(round(float(match.group(1).replace(",", "")) * unit))
+
+
+def format_count(n):
+    """``n`` in the page's notation: 597, 3.4k, 155k, 4.6 Million."""
+    if n >= 999_950:  # rounds to "1 Million", not "1000k"
+        return f"{n / 10 ** 6:.1f}".removesuffix(".0") + " Million"
+    if n >= 1000:
+        return f"{n / 10 ** 3:.1f}".removesuffix(".0") + "k"
+    return str(n)
+
+
+def format_at_least(n):
+    """``n`` rounded down to two significant figures, for "over ..." sentences: 36 million, 310,000, 6,200."""
+    if n >= 100:
+        step = 10 ** (len(str(n)) - 2)
+        n -= n % step
+    if n >= 10 ** 6:
+        return f"{n / 10 ** 6:g} million"
+    return f"{n:,}"
+
+
+def stat_lines(edit):
+    """The bullet lines shown (and searched) for one video edit."""
+    return (f"Views: {format_count(edit.views)}", f"Reactions: {format_count(edit.reactions)}",
+            f"Comments: {format_count(edit.comments)}")
+
+
+def summarise(edits):
+    """Totals and per-edit chart figures for ``edits``, vectorised over all of them at once."""
+    import numpy as np
+
+    counts = np.array([[getattr(e, f) for f in FIELDS] for e in edits], dtype=np.int64).reshape(-1, len(FIELDS))
+    views = counts[:, 0]
+    peak = views.max(initial=0)
+    widths = views * 100.0 / peak if peak else np.zeros(len(views))
+    engaged = counts[:, 1:].sum(axis=1)
+    rates = np.divide(engaged, views, out=np.zeros(len(views)), where=views > 0)
+    return Summary(tuple(int(t) for t in counts.sum(axis=0)),
+                   tuple(float(w) for w in widths), tuple(float(r) for r in rates))
+
+
+def fill_totals(text, totals):
+    """``text`` with ``{video_views}``-style placeholders replaced by ``totals``."""
+    if "{video_" not in text:
+        return text
+    for name, total in zip(FIELDS, totals):
+        text = text.replace(f"{{video_{name}}}", format_at_least(total))
+    return text
+
+
+if __name__ == "__main__":
+    import content
+
+    site = content.load_content()
+    summary = summarise(site.video_edits)
+    for edit, rate in zip(site.video_edits, summary.rates):
+        print(f"{edit.title:24} {edit.views:>12,} {edit.reactions:>10,} {edit.comments:>8,}  {rate:6.2%} engaged")
+    print(f"{'total':24} " + " ".join(f"{t:>{w},}" for t, w in zip(summary.totals, (12, 10, 8))))
@@ -0,0 +1,135 @@
+"""
+Static-site export: the whole portfolio as plain HTML + CSS + local assets.
+
+The page is assembled from the same compiled section HTML (render.py),
+sidebar markup (shell.py) and stylesheet (styles.py) the Streamlit app uses,
+with expanders as <details>. The result can be served from any static file
+server or CDN with no Python process per visitor.
+
+``out_dir`` is replaced on every export, so it has to be empty, missing, or
+a previous export (marked by a ``.portfolio-export`` file); anything else is
+refused rather than deleted.
+
+Usage:
+    python export.py [out_dir]          # default: dist/
+"""
+import hashlib
+import os
+import shutil
+import sys
+
+import assets
+import content
+import render
+import sections
+import shell
+import styles
+from render import escape
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUT_DIR = os.path.join(APP_DIR, "dist")
+PAGE_TITLE = "My Portfolio"
+MARKER = ".portfolio-export"
+
+# Layout the Streamlit shell normally provides (sidebar, main column, expanders).
+EXPORT_CSS = """
+body{margin:0}
+.layout{display:flex;min-height:100vh}
+.sidebar-links{width:250px;flex-shrink:0;padding:2rem 1.5rem;background-color:#2c3e50;box-sizing:border-box}
+.sidebar-links #menu-font{color:#ecf0f1}
+main{flex:1;padding:2rem 3rem;max-width:960px}
+.section-nav{display:flex;gap:2px;border-bottom:2px solid #ddd;margin-bottom:1rem}
+.section-nav a{padding:.5rem 1rem;background-color:#ecf0f1;color:#2c3e50;border-radius:8px 8px 0 0;text-decoration:none}
+.section-nav a:hover{background-color:#bdc3c7}
+section{padding-top:1rem}
+details{border:1px solid #ddd;border-radius:8px;margin-bottom:10px;background-color:#fff;padding:.5rem 1rem}
+summary{cursor:pointer;font-weight:bold;color:#2c3e50}
+@media (max-width:700px){.layout{flex-direction:column}.sidebar-links{width:100%}main{padding:1rem}}
+"""
+
+
+def _details(summary, body):
+    return f"<details><summary>{escape(summary)}</summary>{body}</details>"
+
+
+def _anchor(title):
+    return sections.MENU[title].replace("_", "-")
+
+
+def section_bodies(site, compiled):
+    """HTML for each menu section, mirroring the modules in sections/."""
+    home = (
+        compiled["header"]
+        + "<hr><h3>Skills</h3>"
+        + render.skills_grid_html(site.skills, site.tenant)
+    )
+    work_samples = (
+        "<h2>My Work Samples</h2>"
+        + _details("Projects", compiled["projects"])
+        + _details("Video Edits", compiled["video_edits"])
+        + _details("Social media management", compiled["social_accounts"])
+        + _details("Podcast", compiled["podcasts"])
+    )
+    experience = (
+        "<h2>My Experience</h2>"
+        + "".join(_details(title, body) for title, body in compiled["experience"])
+        + "<h3>Education</h3>"
+        + "".join(_details(title, body) for title, body in compiled["education"])
+    )
+    return {"Home": home, "Work Samples": work_samples, "Experience": experience}
+
+
+def render_page(site, stylesheet_href):
+    compiled = render.compile_site(site)
+    bodies = section_bodies(site, compiled)
+    nav = "".join(f'<a href="#{_anchor(title)}">{escape(title)}</a>' for title in bodies)
+    main = "".join(f'<section id="{_anchor(title)}">{body}</section>' for title, body in bodies.items())
+    page = (
+        '<!doctype html><html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>{escape(PAGE_TITLE)}</title>"
+        f'<link rel="stylesheet" href="{stylesheet_href}"></head>'
+        '<body><div class="layout">'
+        f'<aside class="sidebar-links">{shell.sidebar_links_html(site)}</aside>'
+        f'<main><nav class="section-nav">{nav}</nav>{main}<hr>{compiled["footer"]}</main>'
+        "</div></body></html>\n"
+    )
+    # Asset URLs are relative to the Streamlit app root; in the bundle they sit next to index.html.
+    return page.replace("app/static/", "static/")
+
+
+def export(out_dir=DEFAULT_OUT_DIR, site=None):
+    """Writes the static bundle to ``out_dir`` and returns the path of index.html."""
+    site = site or content.load_content()
+    if os.path.isdir(out_dir) and os.listdir(out_dir):
+        if not os.path.isfile(os.path.join(out_dir, MARKER)):
+            raise FileExistsError(f"{out_dir} is not empty and holds no previous export; not replacing it")
+        shutil.rmtree(out_dir)
+    os.makedirs(os.path.join(out_dir, "static", "css"))
+    open(os.path.join(out_dir, MARKER), "w").close()
+
+    for name in ("icons", "variants", "files"):
+        src = os.path.join(assets.STATIC_DIR, name)
+        if os.path.isdir(src):
+            shutil.copytree(src, os.path.join(out_dir, "static", name),
+                            ignore=shutil.ignore_patterns("manifest.json", "*.tmp"))
+
+    css = styles.stylesheet()["css"] + styles.minify(EXPORT_CSS)
+    css_name = f"site.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]}.css"
+    with open(os.path.join(out_dir, "static", "css", css_name), "w", encoding="utf-8") as f:
+        f.write(css)
+
+    index_path = os.path.join(out_dir, "index.html")
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write(render_page(site, f"static/css/{css_name}"))
+    return index_path
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUT_DIR
+    try:
+        index = export(target)
+    except FileExistsError as e:
+        sys.exit(str(e))
+    total = sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(target) for f in files)
+    print(f"wrote {index} ({total} bytes in bundle)")
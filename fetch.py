@@ -0,0 +1,220 @@
+"""
+HTTP fetching and image caching used by load_and_resize_image and assets.py.
+
+Three layers:
+- one pooled ``requests.Session`` shared by every session/thread, with
+  connect/read timeouts and a couple of retries on gateway errors;
+- an on-disk cache (``.cache/http``) that stores the body plus ETag /
+  Last-Modified / max-age and revalidates with conditional requests. If the
+  origin is unreachable or erroring, the stale copy is served instead;
+- an in-memory LRU of *encoded* image bytes, capped by the decoded size of
+  the images it holds and per tenant, with hit/miss/eviction counters.
+
+``requests`` and Pillow are imported on first use, not at import time: a
+run that finds everything in the caches never loads them.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from io import BytesIO
+
+import lru
+import metrics
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("PORTFOLIO_CACHE_DIR", os.path.join(APP_DIR, ".cache"))
+DISK_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 10
+MEMORY_CACHE_BYTES = 32 * 1024 * 1024  # decoded bytes held by the image LRU
+IMAGE_OWNER_QUOTA_BYTES = 8 * 1024 * 1024  # of which one tenant may hold this much
+
+
+# --- Shared HTTP session ---
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Returns the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                              allowed_methods=("GET", "HEAD"), raise_on_status=False)
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = "portfolio-fetch/1.0"
+                _session = session
+    return _session
+
+
+# --- Disk cache ---
+class DiskCache:
+    """Stores response bodies and their validators, one pair of files per URL."""
+
+    def __init__(self, directory=DISK_CACHE_DIR):
+        self.directory = directory
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key + ".body"), os.path.join(self.directory, key + ".json")
+
+    def get(self, url):
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                return f.read(), meta
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url, body, headers):
+        os.makedirs(self.directory, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "expires": time.time() + _max_age(headers.get("Cache-Control", "")),
+        }
+        for path, data, mode in ((body_path, body, "wb"), (meta_path, json.dumps(meta), "w")):
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, mode) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return meta
+
+    def refresh(self, url, meta, headers):
+        """Updates the freshness of an entry after a 304."""
+        meta = dict(meta)
+        meta["expires"] = time.time() + _max_age(headers.get("Cache-Control", ""))
+        meta["etag"] = headers.get("ETag") or meta.get("etag")
+        _, meta_path = self._paths(url)
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+
+
+def _max_age(cache_control):
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0
+    match = re.search(r"max-age=(\d+)", cache_control)
+    return int(match.group(1)) if match else 0
+
+
+disk_cache = DiskCache()
+fetch_stats = {"network": 0, "revalidated": 0, "fresh": 0, "stale": 0}
+
+
+def fetch_bytes(url, session=None, cache=None):
+    """
+    Returns the body of ``url``. Fresh disk entries are returned without a
+    request, older ones are revalidated, and if the origin cannot be reached
+    (or answers 5xx) a stale disk entry is served rather than failing.
+    """
+    start = time.perf_counter()
+    try:
+        body, outcome = _fetch(url, session or get_session(), cache or disk_cache)
+    except Exception:
+        metrics.observe("portfolio_image_fetch_seconds", time.perf_counter() - start, outcome="error")
+        raise
+    fetch_stats[outcome] += 1
+    metrics.observe("portfolio_image_fetch_seconds", time.perf_counter() - start, outcome=outcome)
+    return body
+
+
+def _fetch(url, session, cache):
+    """``(body, outcome)`` where outcome is one of the ``fetch_stats`` keys."""
+    import requests
+
+    cached = cache.get(url)
+    headers = {}
+    if cached:
+        body, meta = cached
+        if meta.get("expires", 0) > time.time():
+            return body, "fresh"
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = session.get(url, headers=headers, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+    except requests.RequestException:
+        if cached:
+            return cached[0], "stale"
+        raise
+
+    if response.status_code == 304 and cached:
+        cache.refresh(url, cached[1], response.headers)
+        return cached[0], "revalidated"
+    if response.status_code >= 500 and cached:
+        return cached[0], "stale"
+    response.raise_for_status()
+    cache.put(url, response.content, response.headers)
+    return response.content, "network"
+
+
+# --- In-memory image cache ---
+class ImageLRU(lru.QuotaLRU):
+    """
+    LRU of encoded image bytes. The budget is counted in *decoded* bytes
+    (width * height * channels) since that is what a page of images really
+    costs once it is displayed/re-decoded. Each tenant (owner) may use at
+    most ``IMAGE_OWNER_QUOTA_BYTES`` of it.
+    """
+
+    def __init__(self, max_bytes=MEMORY_CACHE_BYTES, owner_max_bytes=IMAGE_OWNER_QUOTA_BYTES):
+        super().__init__(max_bytes, owner_max_bytes)
+
+    def stats(self):
+        stats = super().stats()
+        stats["decoded_bytes"] = stats.pop("bytes")
+        return stats
+
+
+image_cache = ImageLRU()
+
+
+def load_image_bytes(image_path, width, session=None, owner=""):
+    """
+    Returns ``image_path`` (URL or local file) resized to ``width`` as PNG
+    bytes. Results are cached in ``image_cache``, counted against ``owner``'s
+    quota; bytes are immutable so one entry can safely be shared by every
+    session.
+    """
+    key = (image_path, width)
+    data = image_cache.get(key)
+    if data is not None:
+        return data
+
+    from PIL import Image
+
+    if image_path.startswith("http://") or image_path.startswith("https://"):
+        img = Image.open(BytesIO(fetch_bytes(image_path, session=session)))
+    else:
+        if not os.path.exists(image_path):
+            raise FileNotFoundError(f"Error: Image not found at {image_path}")
+        img = Image.open(image_path)
+    img = img.resize((width, int(img.height * (width / img.width))))
+    out = BytesIO()
+    img.save(out, format="PNG")
+    data = out.getvalue()
+    image_cache.put(key, data, img.width * img.height * len(img.getbands()), owner)
+    return data
+
+
+def cache_stats():
+    """Counters for the memory and disk tiers, e.g. for a debug panel or metrics."""
+    return {"memory": image_cache.stats(), "fetch": dict(fetch_stats)}
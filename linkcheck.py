@@ -0,0 +1,255 @@
+"""
+Background link-health checker for the portfolio's external links.
+
+Every http(s) URL in the content is probed with HEAD, falling back to a
+streamed GET when the server rejects or mishandles HEAD. Probes run on a
+bounded thread pool, at most ``PER_HOST`` at a time per host, each with
+connect/read timeouts. Results are kept in memory and in
+``.cache/linkcheck.json`` and are re-probed once older than their TTL.
+
+The app never probes inline: ``start()`` launches one daemon thread per
+process and the UI only calls ``status()``/``version()``, which read the
+in-memory results. ``PORTFOLIO_LINKCHECK=0`` turns the thread off.
+
+Hosts that refuse bots (LinkedIn's 999, rate-limit 429s) are reported as
+"blocked", not dead.
+
+Usage:
+    python linkcheck.py check     # probe every link now and print the report
+    python linkcheck.py report    # print the cached results
+"""
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Optional
+from urllib.parse import urlsplit
+
+import content
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("PORTFOLIO_CACHE_DIR", os.path.join(APP_DIR, ".cache"))
+CACHE_PATH = os.path.join(CACHE_DIR, "linkcheck.json")
+ENABLED = os.environ.get("PORTFOLIO_LINKCHECK", "1") != "0"
+MAX_WORKERS = 8
+PER_HOST = 2
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 8
+TTL = 6 * 3600         # re-probe healthy links after this many seconds
+FAILED_TTL = 30 * 60   # and broken/unreachable ones sooner
+CHECK_INTERVAL = 5 * 60
+BLOCKED_STATUSES = (429, 999)
+HEAD_UNSUPPORTED = (403, 404, 405, 501)  # worth a GET before calling the link dead
+
+
+@dataclass(frozen=True)
+class LinkStatus:
+    url: str
+    state: str                  # "ok", "dead", "blocked" or "error"
+    status: Optional[int] = None
+    method: str = "HEAD"
+    reason: str = ""
+    elapsed_ms: float = 0.0
+    checked_at: float = 0.0
+
+    @property
+    def dead(self):
+        return self.state in ("dead", "error")
+
+    def fresh(self, now=None):
+        ttl = FAILED_TTL if self.dead else TTL
+        return (now or time.time()) - self.checked_at < ttl
+
+
+def urls(site):
+    """Every distinct http(s) URL in the content, in page order."""
+    items = (list(site.links) + list(site.skills) + list(site.projects) + list(site.video_edits)
+             + list(site.social_accounts) + list(site.podcasts))
+    seen = {}
+    for item in items:
+        if item.url and item.url.startswith(("http://", "https://")):
+            seen.setdefault(item.url, None)
+    return list(seen)
+
+
+# --- Probing ---
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """A session of its own: no retries, since a retried 5xx would hide rot."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=PER_HOST, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = "Mozilla/5.0 (compatible; portfolio-linkcheck/1.0)"
+                _session = session
+    return _session
+
+
+def _classify(status):
+    if status in BLOCKED_STATUSES:
+        return "blocked"
+    return "ok" if status < 400 else "dead"
+
+
+def probe(url, session=None, timeout=None):
+    """Checks one URL: HEAD, then a streamed GET if HEAD was refused or failed."""
+    import requests
+
+    session = session or get_session()
+    timeout = timeout or (CONNECT_TIMEOUT, READ_TIMEOUT)
+    start = time.perf_counter()
+    method = "HEAD"
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+        if response.status_code not in BLOCKED_STATUSES and \
+                (response.status_code in HEAD_UNSUPPORTED or response.status_code >= 500):
+            method = "GET"
+            with session.get(url, allow_redirects=True, timeout=timeout, stream=True) as response:
+                pass  # the status line is enough; the body is never read
+        state, status, reason = _classify(response.status_code), response.status_code, response.reason or ""
+    except requests.Timeout:
+        state, status, reason = "error", None, "timed out"
+    except requests.RequestException as e:
+        state, status, reason = "error", None, type(e).__name__
+    return LinkStatus(url, state, status, method, reason,
+                      round((time.perf_counter() - start) * 1000, 1), time.time())
+
+
+class Checker:
+    """Probes URLs concurrently with a per-host limit and keeps the results."""
+
+    def __init__(self, cache_path=CACHE_PATH, max_workers=MAX_WORKERS, per_host=PER_HOST):
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.results = {}
+        self.version = 0  # bumped whenever a link turns dead or recovers
+        self._hosts = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path) as f:
+                self.results = {url: LinkStatus(**row) for url, row in json.load(f).items()}
+        except (OSError, ValueError, TypeError):
+            self.results = {}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({url: asdict(s) for url, s in self.results.items()}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+
+    def _host_slot(self, url):
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return self._hosts[host]
+
+    def _probe(self, url, session):
+        with self._host_slot(url):
+            return probe(url, session)
+
+    def stale(self, url_list, now=None):
+        return [url for url in url_list if url not in self.results or not self.results[url].fresh(now)]
+
+    def check(self, url_list, force=False, session=None):
+        """Probes the URLs in ``url_list`` that are missing or past their TTL; returns how many."""
+        todo = list(url_list) if force else self.stale(url_list)
+        if not todo:
+            return 0
+        session = session or get_session()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(todo)),
+                                thread_name_prefix="linkcheck") as pool:
+            for result in pool.map(lambda url: self._probe(url, session), todo):
+                previous = self.results.get(result.url)
+                if (previous is not None and previous.dead) != result.dead:
+                    self.version += 1
+                self.results[result.url] = result
+        self._save()
+        return len(todo)
+
+
+checker = None
+_checker_lock = threading.Lock()
+
+
+def get_checker():
+    global checker
+    if checker is None:
+        with _checker_lock:
+            if checker is None:
+                checker = Checker()
+    return checker
+
+
+# --- What the UI reads (never blocks on the network) ---
+def status(url):
+    """The last known ``LinkStatus`` of ``url``, or None if it was never checked."""
+    return get_checker().results.get(url)
+
+
+def version():
+    return get_checker().version
+
+
+# --- Background thread ---
+def _loop():
+    while True:
+        try:
+            get_checker().check(urls(content.load_content()))
+        except Exception as e:  # keep checking on the next round
+            print(f"linkcheck: {type(e).__name__}: {e}", file=sys.stderr)
+        time.sleep(CHECK_INTERVAL)
+
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def start():
+    """Starts the background checker once per process."""
+    global _started
+    if not ENABLED or _started:
+        return
+    with _start_lock:
+        if not _started:
+            threading.Thread(target=_loop, name="linkcheck", daemon=True).start()
+            _started = True
+
+
+def report(url_list, results):
+    """Plain-text report, broken links first."""
+    order = {"dead": 0, "error": 1, "blocked": 2, "ok": 3, "unchecked": 4}
+    rows = sorted((results.get(url) or LinkStatus(url, "unchecked", method="-") for url in url_list),
+                  key=lambda s: (order[s.state], s.url))
+    lines = []
+    for s in rows:
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(s.checked_at)) if s.checked_at else "never"
+        lines.append(f"{s.state:8} {s.status or '-':>4} {s.method:4} {s.elapsed_ms:>8.0f} ms  {when}  {s.url}"
+                     + (f"  ({s.reason})" if s.reason and s.dead else ""))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "report"
+    links = urls(content.load_content())
+    if command == "check":
+        get_checker().check(links, force=True)
+    print(report(links, get_checker().results))
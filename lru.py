@@ -0,0 +1,124 @@
+"""
+Byte-bounded LRU caches with per-owner quotas.
+
+Every entry belongs to an owner (a tenant slug, see tenants.py; "" for the
+single-portfolio setup) and costs a caller-estimated number of bytes. Two
+limits apply:
+- the whole cache holds at most ``max_bytes``, least recently used out first;
+- one owner holds at most ``owner_max_bytes``. An owner over its quota
+  evicts its own oldest entries, so one large or busy portfolio cannot push
+  everyone else's out. A single entry costing more than the quota is still
+  stored, counted at the quota (so it pushes out the rest of its owner's
+  entries) and reported on stderr; not storing it would rebuild it on every
+  ``memo`` call.
+
+Values must be immutable (strings, frozen dataclasses, read-only indexes):
+one entry is shared by every session of its owner.
+
+``shared`` holds the per-tenant content, compiled HTML, sidebar markup and
+search indexes. ``memo`` keeps one version of each (owner, kind) in it.
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+SHARED_CACHE_BYTES = 64 * 1024 * 1024
+OWNER_QUOTA_BYTES = 2 * 1024 * 1024
+
+
+class QuotaLRU:
+    def __init__(self, max_bytes, owner_max_bytes=None):
+        self.max_bytes = max_bytes
+        self.owner_max_bytes = min(owner_max_bytes or max_bytes, max_bytes)
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()  # key -> (value, cost, owner), least recently used first
+        self._owners = {}            # owner -> OrderedDict of that owner's keys, same order
+        self._owner_bytes = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self._owners[item[2]].move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def _remove(self, key):
+        _, cost, owner = self._items.pop(key)
+        self.current_bytes -= cost
+        keys = self._owners[owner]
+        del keys[key]
+        self._owner_bytes[owner] -= cost
+        if not keys:
+            del self._owners[owner], self._owner_bytes[owner]
+
+    def put(self, key, value, cost, owner=""):
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            if cost > self.owner_max_bytes:
+                print(f"lru: {key!r} costs {cost} bytes, over the {self.owner_max_bytes} byte quota of "
+                      f"owner {owner!r}; keeping it alone at the quota", file=sys.stderr)
+                cost = self.owner_max_bytes
+            self._items[key] = (value, cost, owner)
+            self._owners.setdefault(owner, OrderedDict())[key] = None
+            self._owner_bytes[owner] = self._owner_bytes.get(owner, 0) + cost
+            self.current_bytes += cost
+            while self._owner_bytes[owner] > self.owner_max_bytes:
+                self._remove(next(iter(self._owners[owner])))
+                self.evictions += 1
+            while self.current_bytes > self.max_bytes:
+                self._remove(next(iter(self._items)))
+                self.evictions += 1
+
+    def owner_bytes(self, owner):
+        return self._owner_bytes.get(owner, 0)
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._items),
+            "owners": len(self._owners),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "owner_max_bytes": self.owner_max_bytes,
+        }
+
+
+def text_bytes(value):
+    """Rough size of nested str/bytes containers: the strings they hold."""
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sum(text_bytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(text_bytes(v) for v in value)
+    return 0
+
+
+shared = QuotaLRU(SHARED_CACHE_BYTES, OWNER_QUOTA_BYTES)
+
+
+def memo(owner, kind, version, build, cost=text_bytes, cache=None):
+    """
+    The ``kind`` value of ``owner`` built for ``version``; built and stored
+    on a miss or a version change. One version per (owner, kind) is kept, so
+    an edit or a link-check update replaces the old entry instead of piling up.
+    """
+    cache = cache or shared
+    key = (owner, kind)
+    item = cache.get(key)
+    if item is not None and item[0] == version:
+        return item[1]
+    value = build()
+    cache.put(key, (version, value), cost(value), owner)
+    return value
@@ -0,0 +1,328 @@
+"""
+Prometheus-style metrics for the running app.
+
+What is recorded:
+- ``portfolio_script_run_seconds``           one full run of haha.py
+- ``portfolio_section_render_seconds``       per section (Home, Work Samples, Experience)
+- ``portfolio_sidebar_render_seconds``       the sidebar shell
+- ``portfolio_image_fetch_seconds``          fetch.fetch_bytes, by outcome (fresh/revalidated/network/stale/error)
+- ``portfolio_image_errors_total``           load_and_resize_image falling into its st.error paths
+- ``portfolio_analytics_{written,dropped}_total``  analytics events stored / lost (analytics.py)
+- ``portfolio_image_cache_{hits,misses,evictions}_total``, ``portfolio_active_sessions``,
+  ``portfolio_shared_cache_{hits,misses,evictions}_total``, ``portfolio_shared_cache_{bytes,tenants}``,
+  ``portfolio_analytics_queued``
+                                             read from their sources when the metrics are collected
+
+Recording is lock-free: every thread writes into its own shard (a plain dict
+reached through ``threading.local``), and only ``collect()`` walks the shards.
+Shards of threads that have exited are folded into one retired shard there,
+so the shard list does not grow with every session ever served.
+
+The text exposition is written atomically to ``PORTFOLIO_METRICS_FILE``
+every ``FLUSH_INTERVAL`` seconds (point node_exporter's textfile collector at
+it) and can also be served on ``PORTFOLIO_METRICS_PORT``, bound to
+``PORTFOLIO_METRICS_HOST`` (127.0.0.1 unless set; a port that cannot be
+bound is reported and skipped). ``PORTFOLIO_METRICS=0`` turns everything
+into no-ops.
+
+Usage:
+    python metrics.py            # print the current metrics file
+"""
+import atexit
+import bisect
+import functools
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ENABLED = os.environ.get("PORTFOLIO_METRICS", "1") != "0"
+CACHE_DIR = os.environ.get("PORTFOLIO_CACHE_DIR", os.path.join(APP_DIR, ".cache"))
+METRICS_FILE = os.environ.get("PORTFOLIO_METRICS_FILE", os.path.join(CACHE_DIR, "metrics.prom"))
+METRICS_PORT = int(os.environ.get("PORTFOLIO_METRICS_PORT", "0"))
+METRICS_HOST = os.environ.get("PORTFOLIO_METRICS_HOST", "127.0.0.1")
+FLUSH_INTERVAL = 15
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HELP = {
+    "portfolio_script_run_seconds": ("histogram", "Time to run haha.py once."),
+    "portfolio_section_render_seconds": ("histogram", "Time to render one portfolio section."),
+    "portfolio_sidebar_render_seconds": ("histogram", "Time to render the sidebar."),
+    "portfolio_image_fetch_seconds": ("histogram", "fetch_bytes duration by outcome."),
+    "portfolio_image_errors_total": ("counter", "Images that could not be loaded, by kind."),
+    "portfolio_image_cache_hits_total": ("counter", "In-memory image cache hits."),
+    "portfolio_image_cache_misses_total": ("counter", "In-memory image cache misses."),
+    "portfolio_image_cache_evictions_total": ("counter", "In-memory image cache evictions."),
+    "portfolio_active_sessions": ("gauge", "Browser sessions currently connected."),
+    "portfolio_shared_cache_hits_total": ("counter", "Shared per-tenant cache hits (lru.py)."),
+    "portfolio_shared_cache_misses_total": ("counter", "Shared per-tenant cache misses."),
+    "portfolio_shared_cache_evictions_total": ("counter", "Shared per-tenant cache evictions."),
+    "portfolio_shared_cache_bytes": ("gauge", "Estimated bytes held by the shared per-tenant cache."),
+    "portfolio_shared_cache_tenants": ("gauge", "Tenants with entries in the shared cache."),
+    "portfolio_analytics_written_total": ("counter", "Analytics events written to SQLite."),
+    "portfolio_analytics_dropped_total": ("counter", "Analytics events dropped (queue full or write failed)."),
+    "portfolio_analytics_queued": ("gauge", "Analytics events waiting for the writer thread."),
+}
+
+
+# --- Recording (hot path) ---
+_local = threading.local()
+_shards = []  # (thread, shard) for every thread that has recorded something
+_retired = {}
+_shards_lock = threading.Lock()
+
+
+def _shard():
+    shard = getattr(_local, "shard", None)
+    if shard is None:
+        shard = _local.shard = {}
+        with _shards_lock:  # once per thread
+            _shards.append((threading.current_thread(), shard))
+    return shard
+
+
+def observe(name, seconds, **labels):
+    """Adds one observation to the histogram ``name``."""
+    if not ENABLED:
+        return
+    shard = _shard()
+    key = (name, tuple(sorted(labels.items())))
+    series = shard.get(key)
+    if series is None:
+        series = shard[key] = [0] * (len(BUCKETS) + 2)  # buckets..., +Inf/count, sum
+    series[bisect.bisect_left(BUCKETS, seconds)] += 1
+    series[-1] += seconds
+
+
+def inc(name, value=1, **labels):
+    """Adds ``value`` to the counter ``name``."""
+    if not ENABLED:
+        return
+    shard = _shard()
+    key = (name, tuple(sorted(labels.items())))
+    shard[key] = shard.get(key, 0) + value
+
+
+class _Timer:
+    __slots__ = ("name", "labels", "start")
+
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.done()
+
+    def done(self):
+        observe(self.name, time.perf_counter() - self.start, **self.labels)
+
+
+class _DisabledTimer(nullcontext):
+    def done(self):
+        pass
+
+
+_disabled_timer = _DisabledTimer()
+
+
+def timer(name, **labels):
+    """``with metrics.timer(...):`` records the block's duration into a histogram."""
+    return _Timer(name, labels) if ENABLED else _disabled_timer
+
+
+def script_run():
+    """Started at the top of haha.py; ``.done()`` at the bottom records the run."""
+    return _Timer("portfolio_script_run_seconds", {}).__enter__() if ENABLED else _disabled_timer
+
+
+def timed(name, **labels):
+    """
+    Decorator form of ``timer``. Put it under ``@st.fragment`` so fragment
+    reruns, which call the function directly, are timed too.
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Timer(name, labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+# --- Collecting ---
+def _merge(into, shard):
+    # Copy the items first: the owning thread may add keys while we read.
+    for key, value in list(shard.items()):
+        if isinstance(value, list):
+            target = into.setdefault(key, [0] * len(value))
+            for i, v in enumerate(value):
+                target[i] += v
+        else:
+            into[key] = into.get(key, 0) + value
+
+
+def snapshot():
+    """All recorded series summed over every thread: ``{(name, labels): value}``."""
+    total = {}
+    with _shards_lock:
+        live = []
+        for thread, shard in _shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                _merge(_retired, shard)
+        _shards[:] = live
+        _merge(total, _retired)
+    for _, shard in live:
+        _merge(total, shard)
+    return total
+
+
+def _sources():
+    """Values that already exist elsewhere and are read rather than recorded."""
+    import analytics
+    import fetch
+    import lru
+    series = {}
+    cache = fetch.image_cache.stats()
+    shared = lru.shared.stats()
+    for stat in ("hits", "misses", "evictions"):
+        series[(f"portfolio_image_cache_{stat}_total", ())] = cache[stat]
+        series[(f"portfolio_shared_cache_{stat}_total", ())] = shared[stat]
+    series[("portfolio_shared_cache_bytes", ())] = shared["bytes"]
+    series[("portfolio_shared_cache_tenants", ())] = shared["owners"]
+    series[("portfolio_analytics_queued", ())] = analytics.queued()
+    try:
+        from streamlit.runtime import Runtime
+        if Runtime.exists():
+            active = Runtime.instance()._session_mgr.num_active_sessions()
+            if isinstance(active, int):  # AppTest installs a mock runtime
+                series[("portfolio_active_sessions", ())] = active
+    except Exception:
+        pass
+    return series
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def collect():
+    """The Prometheus text exposition (format 0.0.4) of every metric."""
+    series = snapshot()
+    series.update(_sources())
+    by_name = {}
+    for (name, labels), value in series.items():
+        by_name.setdefault(name, []).append((labels, value))
+
+    lines = []
+    for name in sorted(by_name):
+        kind, help_text = HELP.get(name, ("untyped", ""))
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in sorted(by_name[name]):
+            if kind != "histogram":
+                lines.append(f"{name}{_labels(labels)} {_number(value)}")
+                continue
+            cumulative = 0
+            for bound, count in zip(BUCKETS, value):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(labels, [('le', bound)])} {cumulative}")
+            cumulative += value[len(BUCKETS)]
+            lines.append(f"{name}_bucket{_labels(labels, [('le', '+Inf')])} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(value[-1])}")
+            lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+# --- Exporting ---
+def flush(path=None):
+    """Writes ``collect()`` to the metrics file atomically."""
+    path = path or METRICS_FILE
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(collect())
+    os.replace(tmp_path, path)
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        try:
+            flush()
+        except OSError as e:
+            print(f"metrics: could not write {METRICS_FILE}: {e}", file=sys.stderr)
+
+
+def _serve(port, host=METRICS_HOST):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = collect().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    try:
+        server = ThreadingHTTPServer((host, port), Handler)
+    except OSError as e:  # port in use: keep the file export, serve pages as usual
+        print(f"metrics: could not serve on {host}:{port}: {e}", file=sys.stderr)
+        return
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def start():
+    """Starts the periodic file flush (and the HTTP endpoint, if configured) once per process."""
+    global _started
+    if not ENABLED or _started:
+        return
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+        threading.Thread(target=_flush_loop, name="metrics-flush", daemon=True).start()
+        atexit.register(flush)
+        if METRICS_PORT:
+            _serve(METRICS_PORT)
+
+
+if __name__ == "__main__":
+    try:
+        with open(METRICS_FILE) as f:
+            sys.stdout.write(f.read())
+    except OSError:
+        sys.exit(f"no metrics file at {METRICS_FILE} (is the app running with PORTFOLIO_METRICS enabled?)")
@@ -0,0 +1,185 @@
+"""
+Compiles portfolio content into HTML strings.
+
+Each section is compiled once per version of content.json (keyed by the file's
+content hash) and kept in the shared LRU (lru.py) under the tenant's quota, so
+a rerun only looks strings up instead of pushing large markdown blocks through
+the markdown renderer. Markup that depends on the icon/variant build state
+(sidebar links, skills) is built by the caller since it changes independently
+of the content. Links the background checker (linkcheck.py) found broken are
+marked, so the compiled HTML is also keyed by ``linkcheck.version()``, and by
+``documents.version()`` since links to published documents (documents.py)
+point at the local copy. The Video Edits chart is plain HTML compiled here
+too, so its aggregation (engagement.py) runs once per content version and no
+rerun pays for it.
+"""
+from html import escape as _escape
+
+import assets
+import documents
+import engagement
+import linkcheck
+import lru
+import variants
+
+
+def escape(text):
+    # "$" would otherwise be picked up as LaTeX by st.markdown.
+    return _escape(text).replace("$", "&#36;")
+
+
+def _dead_title(url):
+    """Tooltip for a link the checker found broken, None for every other link."""
+    if documents.href(url) != url:
+        return None  # served from the local copy, whatever the original does
+    state = linkcheck.status(url)
+    if state is None or not state.dead:
+        return None
+    return f"This link may be broken ({f'HTTP {state.status}' if state.status else state.reason})"
+
+
+def link(text, url):
+    title = _dead_title(url)
+    attrs = f' class="dead-link" title="{escape(title)}"' if title else ""
+    return f'<a href="{escape(documents.href(url))}"{attrs}>{escape(text)}</a>'
+
+
+def icon_link_attrs(url):
+    title = _dead_title(url)
+    return f'class="icon-link dead-link" title="{escape(title)}"' if title else 'class="icon-link"'
+
+
+def bullets(items):
+    return "<ul>" + "".join(f"<li>{escape(item)}</li>" for item in items) + "</ul>" if items else ""
+
+
+class HtmlBuilder:
+    """
+    Gathers the markup of one block (a grid, an expander body) so it can be
+    sent as a single st.markdown element. Streamlit renders every st.markdown
+    call as its own element, so opening a <div> in one call and closing it in
+    another leaves empty elements and the wrapper's CSS never applies.
+    """
+
+    def __init__(self, tag=None, css_class=None):
+        self.tag = tag
+        self.css_class = css_class
+        self.parts = []
+
+    def add(self, html):
+        self.parts.append(html)
+        return self
+
+    def extend(self, items):
+        self.parts.extend(items)
+        return self
+
+    def build(self):
+        body = "".join(self.parts)
+        if not self.tag:
+            return body
+        class_attr = f' class="{self.css_class}"' if self.css_class else ""
+        return f"<{self.tag}{class_attr}>{body}</{self.tag}>"
+
+
+# --- Sections ---
+def header_html(profile):
+    return (
+        f'<h1 class="header-text">{escape(profile.name)}</h1>'
+        f'<h3 class="header-text">{escape(profile.headline)}</h3>'
+        f'<p class="bio-text">{escape(profile.bio)}</p>'
+    )
+
+
+def document_preview_html(title, url):
+    """First-page thumbnail linking to a published document, "" without one."""
+    preview = documents.preview(url)
+    if preview is None:
+        return ""
+    src, width, height = preview
+    return (f'<a href="{escape(documents.href(url))}"><img class="doc-preview" src="{src}" width="{width}" '
+            f'height="{height}" alt="First page of {escape(title)}" loading="lazy"></a>')
+
+
+def project_html(project):
+    return (f"<p><strong>{link(project.title, project.url)}</strong></p>"
+            f"{document_preview_html(project.title, project.url)}{bullets(project.bullets)}")
+
+
+def video_edit_html(edit):
+    return f"<p><strong>{link(edit.title, edit.url)}</strong></p>{bullets(engagement.stat_lines(edit))}"
+
+
+def video_chart_html(edits):
+    """Totals and a views-per-edit bar chart (CSS bars, no chart element) for the Video Edits expander."""
+    if not edits:
+        return ""
+    summary = engagement.summarise(edits)
+    rows = "".join(
+        f'<span>{escape(edit.title)}</span>'
+        f'<span class="video-chart-track" title="{rate:.1%} engagement (reactions and comments per view)">'
+        f'<span class="video-chart-bar" style="width:{width:.1f}%"></span></span>'
+        f'<span>{engagement.format_count(edit.views)}</span>'
+        for edit, width, rate in zip(edits, summary.widths, summary.rates)
+    )
+    totals = ", ".join(f"{engagement.format_count(total)} {name}"
+                       for name, total in zip(engagement.FIELDS, summary.totals))
+    return (f'<p class="video-chart-total">Total: {totals}</p>'
+            f'<div class="video-chart" role="img" aria-label="Views per video edit">{rows}</div>')
+
+
+def social_accounts_html(accounts):
+    return "<ul>" + "".join(f"<li>{link(a.name, a.url)}</li>" for a in accounts) + "</ul>"
+
+
+def job_group_html(group):
+    return "".join(
+        f"<p><strong>{escape(job.company)}</strong><br>{escape(job.role)}</p>{bullets(job.bullets)}"
+        for job in group.jobs
+    )
+
+
+def skill_html(skill, owner=""):
+    """One skills-grid item. Not cached: the icon markup changes as variants finish."""
+    icon = variants.picture_html(skill.icon, alt=skill.name, style="margin-bottom:5px;",
+                                 src=skill.icon_url, width=assets.SKILL_ICON_WIDTH, owner=owner)
+    if skill.url:
+        return (f'<a href="{escape(documents.href(skill.url))}" {icon_link_attrs(skill.url)} '
+                f'style="display:inline-flex; flex-direction:column; align-items:center;">{icon}</a>')
+    return f'<div style="display:inline-flex; flex-direction:column; align-items:center;">{icon}</div>'
+
+
+def skills_grid_html(skills, owner=""):
+    """The whole skills grid as one element; ``owner`` is the tenant the icons are charged to."""
+    return HtmlBuilder("div", "skills-grid").extend(skill_html(skill, owner) for skill in skills).build()
+
+
+def education_html(education):
+    return HtmlBuilder().add(f"<p>{escape(education.dates)}</p>").add(bullets(education.bullets)).build()
+
+
+def footer_html(profile):
+    return f'<p style="text-align: center; color: #777;">{escape(profile.footer)}</p>'
+
+
+def compile_site(site):
+    """
+    Returns the compiled HTML for every section of ``site``. Compiled once per
+    content hash, link-check and documents version; later calls are a cache lookup.
+    """
+    return lru.memo(site.tenant, "compiled", (site.hash, linkcheck.version(), documents.version()),
+                    lambda: _compile(site))
+
+
+def _compile(site):
+    return {
+        "header": header_html(site.profile),
+        "projects": HtmlBuilder().extend(project_html(p) for p in site.projects).build(),
+        "video_edits": video_chart_html(site.video_edits)
+                       + HtmlBuilder().extend(video_edit_html(v) for v in site.video_edits).build(),
+        "social_accounts": social_accounts_html(site.social_accounts),
+        "podcasts": HtmlBuilder().extend(project_html(p) for p in site.podcasts).build(),
+        "experience": [(g.title, job_group_html(g)) for g in site.experience],
+        "education": [(e.title, education_html(e)) for e in site.education],
+        "footer": footer_html(site.profile),
+    }
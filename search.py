@@ -0,0 +1,151 @@
+"""
+Full-text search over the portfolio content.
+
+Every project, video edit, social account, podcast, job, education entry and
+skill becomes one ``Entry`` that knows its menu section and the expander it
+sits in. The inverted index maps each term to ``{entry: weight}`` postings,
+with tf-idf weights computed at build time and words in an entry's label
+weighted higher. The sorted term list makes prefix matching two bisects.
+Multi-word queries intersect from the rarest word, so a query costs about
+the size of its smallest posting list plus its prefix expansions.
+
+The index is built once per content hash and shared by every session of the
+tenant, in the shared LRU like render.compile_site; queries only touch the
+postings of the matching terms.
+"""
+import bisect
+import heapq
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import engagement
+import lru
+
+MAX_HITS = 8
+LABEL_WEIGHT = 3.0
+PREFIX_WEIGHT = 0.5   # a prefix match counts half as much as the whole word
+MIN_PREFIX = 2        # shorter query words only match whole words
+SNIPPET_CHARS = 90
+# Measured with tracemalloc, for the shared cache's byte budget (lru.py).
+TERM_BYTES = 250
+POSTING_BYTES = 60
+
+_TOKEN = re.compile(r"[0-9a-z]+")
+
+
+def tokens(text):
+    return _TOKEN.findall(text.casefold())
+
+
+def anchor(title):
+    """URL-safe id of an expander title, used as the ``open`` query parameter."""
+    return "-".join(tokens(title))
+
+
+@dataclass(frozen=True)
+class Entry:
+    section: str             # menu title
+    expander: Optional[str]  # expander title, None for items shown directly
+    label: str
+    lines: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Hit:
+    entry: Entry
+    score: float
+    snippet: str
+
+
+def entries(site):
+    """Everything searchable in ``site``, in page order."""
+    items = [Entry("Home", None, skill.name) for skill in site.skills]
+    items += [Entry("Work Samples", "Projects", p.title, p.bullets) for p in site.projects]
+    items += [Entry("Work Samples", "Video Edits", v.title, engagement.stat_lines(v)) for v in site.video_edits]
+    items += [Entry("Work Samples", "Social media management", a.name) for a in site.social_accounts]
+    items += [Entry("Work Samples", "Podcast", p.title, p.bullets) for p in site.podcasts]
+    items += [Entry("Experience", group.title, job.company, (job.role,) + job.bullets)
+              for group in site.experience for job in group.jobs]
+    items += [Entry("Experience", e.title, e.title, (e.dates,) + e.bullets) for e in site.education]
+    return items
+
+
+class Index:
+    def __init__(self, items):
+        self.entries = tuple(items)
+        weights = defaultdict(dict)  # term -> {entry number: weight}
+        for number, entry in enumerate(self.entries):
+            fields = [(LABEL_WEIGHT, entry.label)] + [(1.0, line) for line in entry.lines]
+            for field_weight, text in fields:
+                for term in tokens(text):
+                    weights[term][number] = weights[term].get(number, 0.0) + field_weight
+        total = len(self.entries)
+        self.terms = sorted(weights)
+        self.postings = {
+            term: {number: weight * math.log(1 + total / len(docs)) for number, weight in docs.items()}
+            for term, docs in weights.items()
+        }
+
+    def nbytes(self):
+        """Estimated memory held by the index."""
+        return TERM_BYTES * len(self.terms) + POSTING_BYTES * sum(len(docs) for docs in self.postings.values())
+
+    def _matches(self, word):
+        """``{entry number: score}`` for one query word (whole word or prefix). Read-only."""
+        if len(word) < MIN_PREFIX:
+            return self.postings.get(word, {})
+        # "{" sorts right after "z", so [word, word + "{") is every term starting with word.
+        terms = self.terms[bisect.bisect_left(self.terms, word):bisect.bisect_left(self.terms, word + "{")]
+        if len(terms) == 1 and terms[0] == word:
+            return self.postings[word]
+        scores = {}
+        get = scores.get
+        for term in terms:
+            factor = 1.0 if term == word else PREFIX_WEIGHT
+            for number, weight in self.postings[term].items():
+                weight *= factor
+                if weight > get(number, 0.0):
+                    scores[number] = weight
+        return scores
+
+    def search(self, query, limit=MAX_HITS):
+        """Entries containing every word of ``query`` (as a word or prefix), best first."""
+        words = tokens(query)
+        if not words:
+            return []
+        matches = sorted((self._matches(word) for word in words), key=len)
+        scores = matches[0]
+        for other in matches[1:]:
+            scores = {number: score + other[number] for number, score in scores.items() if number in other}
+            if not scores:
+                return []
+        best = heapq.nlargest(limit, scores, key=scores.get)  # ties keep page order
+        return [Hit(self.entries[number], round(scores[number], 3), snippet(self.entries[number], words))
+                for number in best]
+
+
+def snippet(entry, words):
+    """
+    The first line of ``entry`` that mentions a query word, trimmed around it;
+    the first line (e.g. a job's role) when only the label matched.
+    """
+    for line in entry.lines:
+        folded = line.casefold()
+        for word in words:
+            match = re.search(r"\b" + re.escape(word), folded)
+            if match:
+                start = max(0, match.start() - SNIPPET_CHARS // 3)
+                text = line[start:start + SNIPPET_CHARS]
+                return ("…" if start else "") + text + ("…" if start + SNIPPET_CHARS < len(line) else "")
+    if entry.lines:
+        line = entry.lines[0]
+        return line[:SNIPPET_CHARS] + ("…" if len(line) > SNIPPET_CHARS else "")
+    return ""
+
+
+def index_for(site):
+    """The index of ``site``, built once per content hash."""
+    return lru.memo(site.tenant, "search", site.hash, lambda: Index(entries(site)), cost=Index.nbytes)
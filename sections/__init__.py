@@ -0,0 +1,30 @@
+"""
+One module per portfolio section, each exposing ``render()``.
+
+Modules are imported the first time their section is shown, so a visitor who
+only ever sees Home never pays for importing Work Samples or Experience.
+"""
+import importlib
+
+MENU = {
+    "Home": "home",
+    "Work Samples": "work_samples",
+    "Experience": "experience",
+}
+
+
+def load(title):
+    """Imports (once per process) and returns the module for a menu title."""
+    return importlib.import_module(f"{__name__}.{MENU[title]}")
+
+
+def render(title):
+    load(title).render()
+
+
+def page(title):
+    """A callable for ``st.Page`` that imports the section on first visit."""
+    def render_page():
+        render(title)
+    render_page.__name__ = MENU[title]
+    return render_page
@@ -0,0 +1,58 @@
+"""Helpers shared by the section modules."""
+import streamlit as st
+
+import analytics
+import fetch
+import metrics
+import render
+import search
+import tenants
+
+
+def site_content():
+    """The session's tenant content and its compiled HTML (both cached; see tenants.py / render.py)."""
+    site = tenants.current_site()
+    return site, render.compile_site(site)
+
+
+def expanded(title):
+    """Whether a search hit deep-linked to the expander ``title`` (``?open=...``)."""
+    return st.query_params.get("open") == search.anchor(title)
+
+
+def _expander_toggled(key, title, tenant):
+    if st.session_state.get(key):
+        analytics.record("expander", title, tenant)
+
+
+def expander(section, title, tenant=""):
+    """
+    ``st.expander(title)``, opened by a search deep link. With expander
+    tracking on (``analytics.TRACK_EXPANDERS``) it records when a visitor
+    opens it, which makes a toggle rerun the section fragment; otherwise it
+    stays a browser-only toggle.
+    """
+    if not analytics.TRACK_EXPANDERS:
+        return st.expander(title, expanded=expanded(title))
+    key = f"expander-{section}-{search.anchor(title)}"
+    return st.expander(title, expanded=expanded(title), key=key,
+                       on_change=_expander_toggled, args=(key, title, tenant))
+
+
+# --- Helper function for image display with caching ---
+def load_and_resize_image(image_path, width, owner=""):
+    """
+    Loads an image from the given path or URL, resizes it, and returns it as PNG bytes.
+    Fetching and caching (pooled session, disk revalidation, memory LRU) live in fetch.py;
+    ``owner`` is the tenant the cached image counts against.
+    """
+    try:
+        return fetch.load_image_bytes(image_path, width, owner=owner)
+    except FileNotFoundError:
+        metrics.inc("portfolio_image_errors_total", kind="not_found")
+        st.error(f"Error: Image not found at {image_path}. Please make sure the image file exists and the path is correct.  The file should be in the same directory as the script, or you need to provide the full path.")
+        return None
+    except Exception as e:
+        metrics.inc("portfolio_image_errors_total", kind="error")
+        st.error(f"Error loading image: {e}")
+        return None
@@ -0,0 +1,21 @@
+"""Experience: job groups and education."""
+import streamlit as st
+
+import metrics
+from sections.common import expander, site_content
+
+
+@st.fragment
+@metrics.timed("portfolio_section_render_seconds", section="experience")
+def render():
+    site, compiled = site_content()
+    st.header("My Experience")
+
+    for group_title, group_html in compiled["experience"]:
+        with expander("experience", group_title, site.tenant):
+            st.markdown(group_html, unsafe_allow_html=True)
+
+    st.subheader("Education")
+    for education_title, education_html in compiled["education"]:
+        with expander("experience", education_title, site.tenant):
+            st.markdown(education_html, unsafe_allow_html=True)
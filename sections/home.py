@@ -0,0 +1,22 @@
+"""Home: header, bio and skills grid."""
+import streamlit as st
+
+import metrics
+from render import skills_grid_html
+from sections.common import load_and_resize_image, site_content
+
+
+@st.fragment
+@metrics.timed("portfolio_section_render_seconds", section="home")
+def render():
+    site, compiled = site_content()
+    profile_image = load_and_resize_image(site.profile.image, 250, site.tenant) if site.profile.image else None
+    if profile_image:
+        image_column, text_column = st.columns([1, 3], gap="medium")
+        image_column.image(profile_image, width=250)
+        text_column.markdown(compiled["header"], unsafe_allow_html=True)
+    else:
+        st.markdown(compiled["header"], unsafe_allow_html=True)
+    st.write("---")
+    st.subheader("Skills")
+    st.markdown(skills_grid_html(site.skills, site.tenant), unsafe_allow_html=True)
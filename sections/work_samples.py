@@ -0,0 +1,24 @@
+"""Work Samples: projects, video edits, social media accounts and podcast."""
+import streamlit as st
+
+import metrics
+from sections.common import expander, site_content
+
+
+@st.fragment
+@metrics.timed("portfolio_section_render_seconds", section="work_samples")
+def render():
+    site, compiled = site_content()
+    st.header("My Work Samples")
+
+    with expander("work_samples", "Projects", site.tenant):
+        st.markdown(compiled["projects"], unsafe_allow_html=True)
+
+    with expander("work_samples", "Video Edits", site.tenant):
+        st.markdown(compiled["video_edits"], unsafe_allow_html=True)
+
+    with expander("work_samples", "Social media management", site.tenant):
+        st.markdown(compiled["social_accounts"], unsafe_allow_html=True)
+
+    with expander("work_samples", "Podcast", site.tenant):
+        st.markdown(compiled["podcasts"], unsafe_allow_html=True)
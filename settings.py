@@ -0,0 +1,45 @@
+"""
+Deployment settings, read from environment variables.
+
+PORTFOLIO_NAV  "pages" (default): st.navigation multipage app; each section
+               module is imported on first visit and runs as a fragment.
+               "tabs": all sections are rendered once into st.tabs and
+               switching between them costs no server rerun.
+               "radio": the sidebar radio picks one section per rerun.
+PORTFOLIO_CONTENT  path of the content file (default: content.json next to
+               the app; read by content.py).
+PORTFOLIO_TENANTS  directory of tenant portfolios, one ``<slug>/content.json``
+               (+ optional theme.json) each, picked with ``?tenant=<slug>``
+               (default: tenants/ next to the app; read by tenants.py).
+PORTFOLIO_MAINTAINER_TOKEN  when set, ``?maintainer=<token>`` shows the
+               maintainer-only panels (link health report) in the sidebar.
+PORTFOLIO_LINKCHECK  "0" disables the background link checker (linkcheck.py).
+PORTFOLIO_ANALYTICS  "0" disables section analytics (analytics.py;
+               PORTFOLIO_ANALYTICS_DB, default .cache/analytics.sqlite3).
+               PORTFOLIO_ANALYTICS_EXPANDERS="1" also records expanders
+               opened, at the cost of a fragment rerun per toggle.
+PORTFOLIO_METRICS  "0" disables metrics collection (read by metrics.py, as are
+               PORTFOLIO_METRICS_FILE, default .cache/metrics.prom, and
+               PORTFOLIO_METRICS_PORT, an optional /metrics HTTP endpoint
+               on PORTFOLIO_METRICS_HOST, default 127.0.0.1).
+PORTFOLIO_CACHE_DIR  where the HTTP, link-check, analytics and metrics
+               caches live (default: .cache/ next to the app).
+PORTFOLIO_STATIC_DIR  where icons, variants, documents and CSS are written
+               (default: static/ next to the app, the folder Streamlit
+               serves at app/static; point it elsewhere only for benchmarks).
+
+Not read by the app, but set it where the server is launched:
+MALLOC_ARENA_MAX=2  glibc keeps up to 8 malloc arenas per core, and memory
+               freed by Streamlit's per-run threads stays spread over them,
+               so RSS creeps up with traffic even though every cache is
+               bounded (benchmarks/tenant_load.py). The devcontainer's
+               server command sets it.
+"""
+import os
+
+NAV_MODES = ("pages", "tabs", "radio")
+NAV_MODE = os.environ.get("PORTFOLIO_NAV", "pages").lower()
+if NAV_MODE not in NAV_MODES:
+    raise ValueError(f"PORTFOLIO_NAV must be one of {NAV_MODES}, got {NAV_MODE!r}")
+
+MAINTAINER_TOKEN = os.environ.get("PORTFOLIO_MAINTAINER_TOKEN", "")
@@ -0,0 +1,149 @@
+"""
+The static shell around the sections: sidebar links, search and footer.
+
+It only depends on the content and the icon build state, and it is emitted
+from the entry script, so fragment reruns inside a section never execute it.
+The markup is built once per content/icon/link-check/document version and
+reused by every session of the tenant (kept in the shared LRU, lru.py).
+
+Search hits deep-link with an ``open=<expander>`` query parameter, which the
+section modules read to expand the matching expander.
+"""
+import hmac
+
+import streamlit as st
+
+import analytics
+import assets
+import documents
+import linkcheck
+import lru
+import metrics
+import render
+import search
+import sections
+import settings
+import variants
+
+MENU_KEY = "menu"
+GOTO_KEY = "search-goto"
+
+def sidebar_links_html(site):
+    key = (site.hash, variants.manifest_version(), linkcheck.version(), documents.version())
+
+    def icon(link):
+        return variants.picture_html(link.icon, alt=link.name, src=link.icon_url,
+                                     width=assets.SIDEBAR_ICON_WIDTH, owner=site.tenant)
+
+    return lru.memo(site.tenant, "sidebar", key, lambda: '<p id="menu-font">Links</p>' + "".join(
+        f'<div class="sidebar-text-icon-container"><a href="{render.escape(documents.href(link.url))}" {render.icon_link_attrs(link.url)}>'
+        f'{icon(link)}</a></div>'
+        for link in site.links
+    ))
+
+
+def _markdown_text(text):
+    # Widget labels and captions are markdown; keep "$" from starting LaTeX.
+    return text.replace("$", "\\$")
+
+
+def _hit_label(hit):
+    where = hit.entry.expander if hit.entry.expander not in (None, hit.entry.label) else hit.entry.section
+    return _markdown_text(f"{hit.entry.label} · {where}")
+
+
+def _open_hit(hit):
+    """
+    Radio/tabs navigation: point the URL at the hit and rerun the whole app.
+    The radio can only be changed before it is drawn, so the section is
+    handed to the next run through ``GOTO_KEY``.
+    """
+    st.query_params["section"] = sections.MENU[hit.entry.section]
+    if hit.entry.expander:
+        st.query_params["open"] = search.anchor(hit.entry.expander)
+    else:
+        st.query_params.pop("open", None)
+    st.session_state[GOTO_KEY] = hit.entry.section
+    st.rerun()
+
+
+@st.fragment
+def search_panel(site, pages=None):
+    """
+    The sidebar search box. Submitting a query reruns only this fragment. Hits
+    are page links when ``pages`` (st.navigation) is given, buttons otherwise.
+    """
+    query = st.text_input("Search", key="search", placeholder="Search projects, jobs, skills...",
+                          label_visibility="collapsed")
+    if not query.strip():
+        return
+    hits = search.index_for(site).search(query)
+    if not hits:
+        st.caption("No matches")
+    for number, hit in enumerate(hits):
+        label = _hit_label(hit)
+        if pages:
+            params = {"open": search.anchor(hit.entry.expander)} if hit.entry.expander else None
+            st.page_link(pages[hit.entry.section], label=label, query_params=params)
+        elif st.button(label, key=f"search-hit-{number}", type="tertiary"):
+            _open_hit(hit)
+        if hit.snippet:
+            st.caption(_markdown_text(hit.snippet))
+
+
+def requested_section():
+    """The menu title a search hit asked for (tabs navigation), if any."""
+    slug = st.query_params.get("section")
+    return next((title for title, module in sections.MENU.items() if module == slug), None)
+
+
+def is_maintainer():
+    """``?maintainer=<PORTFOLIO_MAINTAINER_TOKEN>`` unlocks the maintainer-only panels."""
+    given = st.query_params.get("maintainer")
+    return bool(settings.MAINTAINER_TOKEN and given
+                and hmac.compare_digest(given, settings.MAINTAINER_TOKEN))
+
+
+def render_link_report(site):
+    """Cached link-check results; reading them never waits on the network."""
+    with st.expander("Link health", expanded=False):
+        results = linkcheck.get_checker().results
+        links = linkcheck.urls(site)
+        broken = sum(1 for url in links if url in results and results[url].dead)
+        st.caption(f"{len(links)} links, {broken} broken, {sum(url not in results for url in links)} not checked yet")
+        st.code(linkcheck.report(links, results), language=None)
+
+
+def render_analytics_report(site):
+    """Visits to this portfolio, from the cached summary (at most SUMMARY_TTL seconds old)."""
+    with st.expander("Visitors", expanded=False):
+        st.caption(f"Last {analytics.SUMMARY_DAYS} days; a visit is one browser tab")
+        st.code(analytics.report(analytics.summary(site.tenant)), language=None)
+
+
+@metrics.timed("portfolio_sidebar_render_seconds")
+def render_sidebar(site, menu_items=None, pages=None):
+    """
+    Draws the sidebar. With ``menu_items`` (radio navigation) it also draws
+    the menu and returns the selected item; ``pages`` maps menu titles to
+    st.Page objects for the search hit links.
+    """
+    selected = None
+    with st.sidebar:
+        if menu_items:
+            if GOTO_KEY in st.session_state:
+                st.session_state[MENU_KEY] = st.session_state.pop(GOTO_KEY)
+            st.markdown('<p id="menu-font">Menu</p>', unsafe_allow_html=True)
+            selected = st.radio("Menu", menu_items, key=MENU_KEY, label_visibility="collapsed")
+            st.write("---")
+        search_panel(site, pages)
+        st.markdown(sidebar_links_html(site), unsafe_allow_html=True)
+        if is_maintainer():
+            render_link_report(site)
+            render_analytics_report(site)
+    return selected
+
+
+def render_footer(compiled):
+    st.markdown("---")
+    st.markdown(compiled["footer"], unsafe_allow_html=True)
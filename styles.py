@@ -0,0 +1,213 @@
+"""
+The app stylesheet: styles.css, minified and pruned once per process.
+
+Pruning drops selectors that cannot match anything:
+- classes/ids of our own markup that no app module emits any more;
+- Streamlit hooks (``.stTabs``, ``[data-testid=...]``, ``[data-baseweb=...]``)
+  that the installed Streamlit frontend bundle no longer contains.
+
+``st-emotion-cache-*`` classes are generated by the frontend at runtime, so
+they cannot be checked against the bundle. They are kept but flagged unless
+the installed Streamlit version is listed in ``EMOTION_CACHE_VERIFIED_ON``.
+
+Usage:
+    python styles.py report      # byte savings, dropped and flagged selectors
+    python styles.py build       # also write static/css/app.<hash>.css
+"""
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CSS_PATH = os.path.join(APP_DIR, "styles.css")
+STATIC_DIR = os.environ.get("PORTFOLIO_STATIC_DIR", os.path.join(APP_DIR, "static"))
+CSS_DIR = os.path.join(STATIC_DIR, "css")
+CACHE_DIR = os.environ.get("PORTFOLIO_CACHE_DIR", os.path.join(APP_DIR, ".cache"))
+STATIC_URL = "app/static/css"
+# Files whose markup can carry our own class/id names.
+MARKUP_SOURCES = ("*.py", "sections/*.py")
+# Streamlit versions the st-emotion-cache-* selectors in styles.css were checked against.
+EMOTION_CACHE_VERIFIED_ON = ()
+
+_EMOTION = re.compile(r"\.st-emotion-cache-[\w-]+")
+_CLASS_OR_ID = re.compile(r"([.#])(-?[_a-zA-Z][\w-]*)")
+_ATTRIBUTE = re.compile(r"\[(data-testid|data-baseweb)\s*=\s*\"([^\"]+)\"\]")
+_MARKUP_ATTR = re.compile(r"\b(class|id)\s*=\s*[\"']([^\"'{}]*)[\"']")
+# render.HtmlBuilder(tag, css_class) writes the class attribute itself.
+_BUILDER_CLASS = re.compile(r"HtmlBuilder\(\s*[\"'][\w-]*[\"']\s*,\s*(?:css_class\s*=\s*)?[\"']([^\"'{}]*)[\"']")
+
+
+# --- Minifying ---
+def minify(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    # Only strip after ":"; a space before it can be a descendant combinator.
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def parse_rules(css):
+    """Splits minified, flat CSS into (selector list, declarations) pairs."""
+    return [
+        ([s.strip() for s in selectors.split(",")], body)
+        for selectors, body in re.findall(r"([^{}]+)\{([^{}]*)\}", css)
+    ]
+
+
+# --- What can match ---
+def markup_names():
+    """Every class and id our own modules put into markup (attributes and HtmlBuilder classes)."""
+    names = set()
+    for pattern in MARKUP_SOURCES:
+        for path in glob.glob(os.path.join(APP_DIR, pattern)):
+            with open(path, encoding="utf-8") as f:
+                source = f.read()
+            for _, value in _MARKUP_ATTR.findall(source):
+                names.update(value.split())
+            for value in _BUILDER_CLASS.findall(source):
+                names.update(value.split())
+    return names
+
+
+def streamlit_version():
+    try:
+        import streamlit
+        return streamlit.__version__
+    except ImportError:
+        return None
+
+
+def frontend_has(tokens):
+    """
+    Which of ``tokens`` appear as string literals in the installed Streamlit
+    frontend bundle. Cached per Streamlit version in .cache/.
+    """
+    version = streamlit_version()
+    if version is None:
+        return set(tokens)
+    cache_path = os.path.join(CACHE_DIR, f"streamlit-frontend-{version}.json")
+    try:
+        with open(cache_path) as f:
+            known = json.load(f)
+    except (OSError, ValueError):
+        known = {}
+    missing = [t for t in tokens if t not in known]
+    if missing:
+        import streamlit
+        bundle_dir = os.path.join(os.path.dirname(streamlit.__file__), "static")
+        texts = []
+        for path in glob.glob(os.path.join(bundle_dir, "**", "*.js"), recursive=True):
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                texts.append(f.read())
+        bundle = "\n".join(texts)
+        for token in missing:
+            known[token] = bool(re.search(r"[\"'`\s]" + re.escape(token) + r"[\"'`\s]", bundle))
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(known, f, indent=2, sort_keys=True)
+    return {t for t in tokens if known[t]}
+
+
+def _streamlit_tokens(selector):
+    tokens = [name for kind, name in _CLASS_OR_ID.findall(selector)
+              if kind == "." and name.startswith("st") and not name.startswith("st-emotion-cache-")]
+    return tokens + [value for _, value in _ATTRIBUTE.findall(selector)]
+
+
+def _own_names(selector):
+    return [name for kind, name in _CLASS_OR_ID.findall(_ATTRIBUTE.sub("", selector))
+            if not (kind == "." and name.startswith("st"))]
+
+
+# --- Build ---
+def build(css=None):
+    """
+    Returns the minified, pruned stylesheet plus a report of what was
+    dropped (``dropped``) and which selectors are brittle (``flagged``).
+    """
+    if css is None:
+        with open(CSS_PATH, encoding="utf-8") as f:
+            css = f.read()
+    minified = minify(css)
+    rules = parse_rules(minified)
+    own = markup_names()
+    live_streamlit = frontend_has(sorted({t for sels, _ in rules for s in sels for t in _streamlit_tokens(s)}))
+    emotion_verified = streamlit_version() in EMOTION_CACHE_VERIFIED_ON
+
+    out, dropped, flagged = [], [], []
+    for selectors, body in rules:
+        kept = []
+        for selector in selectors:
+            if any(name not in own for name in _own_names(selector)) or \
+                    any(t not in live_streamlit for t in _streamlit_tokens(selector)):
+                dropped.append(selector)
+                continue
+            if _EMOTION.search(selector) and not emotion_verified:
+                flagged.append(selector)
+            kept.append(selector)
+        if kept:
+            out.append(",".join(kept) + "{" + body + "}")
+    pruned = "".join(out)
+    return {
+        "css": pruned,
+        "hash": hashlib.sha256(pruned.encode("utf-8")).hexdigest()[:12],
+        "bytes": {"source": len(css.encode("utf-8")), "minified": len(minified.encode("utf-8")),
+                  "pruned": len(pruned.encode("utf-8"))},
+        "dropped": dropped,
+        "flagged": flagged,
+    }
+
+
+_built = None
+_build_lock = threading.Lock()
+
+
+def stylesheet():
+    """The build result, computed once per process."""
+    global _built
+    if _built is None:
+        with _build_lock:
+            if _built is None:
+                _built = build()
+                if _built["flagged"]:
+                    print(f"styles.css: st-emotion-cache selectors not verified on Streamlit "
+                          f"{streamlit_version()}: {', '.join(_built['flagged'])}", file=sys.stderr)
+    return _built
+
+
+def style_tag(extra_css=""):
+    """The stylesheet as a <style> tag; ``extra_css`` (a tenant theme) comes last and wins."""
+    return f"<style>{stylesheet()['css']}{extra_css}</style>"
+
+
+def write_static():
+    """Writes ``static/css/app.<hash>.css`` and returns its app-relative URL."""
+    built = stylesheet()
+    file_name = f"app.{built['hash']}.css"
+    os.makedirs(CSS_DIR, exist_ok=True)
+    path = os.path.join(CSS_DIR, file_name)
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(built["css"])
+    return f"{STATIC_URL}/{file_name}"
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "report"
+    result = stylesheet()
+    sizes = result["bytes"]
+    print(f"source   {sizes['source']:>6} B")
+    print(f"minified {sizes['minified']:>6} B")
+    print(f"pruned   {sizes['pruned']:>6} B  ({100 * (1 - sizes['pruned'] / sizes['source']):.0f}% smaller than source)")
+    for selector in result["dropped"]:
+        print(f"dropped  {selector}")
+    for selector in result["flagged"]:
+        print(f"flagged  {selector}  (st-emotion-cache class, not verified on Streamlit {streamlit_version()})")
+    if command == "build":
+        print(f"wrote    {write_static()}")
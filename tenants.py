@@ -0,0 +1,174 @@
+"""
+Multi-tenant mode: many portfolios served by one process.
+
+``TENANT_DIR`` (``PORTFOLIO_TENANTS``, default ``tenants/``) holds one folder
+per portfolio:
+
+    tenants/<slug>/content.json   same schema as the app's content.json
+    tenants/<slug>/theme.json     optional: {"page_title": ..., "heading": "#1d3557", ...}
+
+A visitor picks a portfolio with ``?tenant=<slug>``. The choice is kept in
+session state and written back to the URL when a page switch drops it
+(st.navigation clears query parameters). Without the parameter the app shows
+its own content.json, so single-portfolio deployments are unchanged.
+Streamlit owns the URL path (it names the pages), so a path like ``/alice/``
+has to be rewritten to ``?tenant=alice`` by the reverse proxy.
+
+Nothing is loaded up front. A tenant's parsed content and theme are kept in
+the shared byte-bounded LRU (lru.py) under the tenant's quota. So are its
+compiled HTML, sidebar markup, search index and any icons the app's own
+registry does not have (render.py, shell.py, search.py, assets.py). Memory stays bounded however many portfolios the directory
+holds, and an evicted tenant is rebuilt from its files on the next visit.
+
+Usage:
+    python tenants.py list       # every tenant, checked for a parseable content.json
+"""
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+import streamlit as st
+
+import content
+import lru
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+TENANT_DIR = os.environ.get("PORTFOLIO_TENANTS", os.path.join(APP_DIR, "tenants"))
+QUERY_PARAM = "tenant"
+SESSION_KEY = "tenant"
+DEFAULT_PAGE_TITLE = "My Portfolio"
+CONTENT_COST_FACTOR = 3  # parsed objects take about this many times the JSON's bytes (tracemalloc)
+
+_SLUG = re.compile(r"[a-z0-9][a-z0-9_-]{0,63}")
+_COLOUR = re.compile(r"#[0-9a-fA-F]{3,8}|[a-zA-Z]{3,20}|rgba?\([0-9., %]+\)")
+
+# theme.json colour keys and the rule each one overrides in styles.css.
+THEME_RULES = {
+    "text": "body{{color:{}}}",
+    "background": "body{{background-color:{}}}",
+    "heading": "h1,h2,h3{{color:{}}}",
+    "link": "a{{color:{}}}",
+    "accent": '.stTabs [data-testid="stTab"][aria-selected="true"],.video-chart-bar{{background-color:{}}}',
+    "sidebar": '[data-testid="stSidebar"]{{background-color:{}}}',
+}
+
+
+class UnknownTenant(LookupError):
+    """``?tenant=`` names a portfolio that does not exist."""
+
+
+@dataclass(frozen=True)
+class Tenant:
+    slug: str
+    directory: str
+
+    @property
+    def content_path(self):
+        return os.path.join(self.directory, "content.json")
+
+    @property
+    def theme_path(self):
+        return os.path.join(self.directory, "theme.json")
+
+
+@dataclass(frozen=True)
+class Theme:
+    page_title: str = DEFAULT_PAGE_TITLE
+    css: str = ""
+
+
+def get(slug):
+    """The tenant called ``slug``, or None if there is no such portfolio."""
+    if not slug or not _SLUG.fullmatch(slug):
+        return None
+    directory = os.path.join(TENANT_DIR, slug)
+    tenant = Tenant(slug, directory)
+    return tenant if os.path.isfile(tenant.content_path) else None
+
+
+def slugs():
+    """Every tenant in ``TENANT_DIR``, sorted."""
+    try:
+        names = os.listdir(TENANT_DIR)
+    except OSError:
+        return []
+    return sorted(name for name in names if get(name) is not None)
+
+
+# --- The current session's tenant ---
+def current():
+    """
+    The tenant this session shows, None for the app's own content.json.
+    Raises ``UnknownTenant`` when ``?tenant=`` names no portfolio.
+    """
+    slug = st.query_params.get(QUERY_PARAM) or st.session_state.get(SESSION_KEY)
+    if not slug:
+        return None
+    tenant = get(slug)
+    if tenant is None:
+        raise UnknownTenant(slug)
+    st.session_state[SESSION_KEY] = slug
+    if st.query_params.get(QUERY_PARAM) != slug:
+        st.query_params[QUERY_PARAM] = slug
+    return tenant
+
+
+def current_site():
+    return load(current())
+
+
+# --- Per-tenant content and theme (in the shared LRU) ---
+def load(tenant):
+    """The parsed content of ``tenant`` (the app's own for None), re-read when its file changes."""
+    if tenant is None:
+        return content.load_content()
+    path = tenant.content_path
+    return lru.memo(tenant.slug, "content", os.path.getmtime(path),
+                    lambda: content.read_content(path, tenant.slug),
+                    cost=lambda _: CONTENT_COST_FACTOR * os.path.getsize(path))
+
+
+def theme_css(values):
+    """CSS overriding the colours named in a theme.json; values that are not colours are skipped."""
+    rules = []
+    for key, template in THEME_RULES.items():
+        value = str(values.get(key, "")).strip()
+        if value and _COLOUR.fullmatch(value):
+            rules.append(template.format(value))
+    return "".join(rules)
+
+
+def _read_theme(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            values = json.load(f)
+    except (OSError, ValueError):  # no theme, or a broken one: the default look
+        return Theme()
+    return Theme(str(values.get("page_title") or DEFAULT_PAGE_TITLE), theme_css(values))
+
+
+def theme(tenant):
+    if tenant is None:
+        return Theme()
+    try:
+        mtime = os.path.getmtime(tenant.theme_path)
+    except OSError:
+        mtime = None
+    return lru.memo(tenant.slug, "theme", mtime, lambda: _read_theme(tenant.theme_path),
+                    cost=lambda t: len(t.page_title) + len(t.css))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["list"]:
+        sys.exit("usage: python tenants.py list")
+    failed = 0
+    for name in slugs():
+        try:
+            site = load(get(name))
+            print(f"{name:24} {site.profile.name}")
+        except (ValueError, KeyError, TypeError) as e:
+            failed += 1
+            print(f"{name:24} INVALID: {type(e).__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,308 @@
+"""
+Responsive variants (1x/2x/3x) of the portfolio images.
+
+For every registered image this writes WebP (and AVIF when Pillow supports
+it) plus a PNG fallback at 1x, 2x and 3x the display width to
+``static/variants/`` and records them in a manifest. The encodes run in a
+process pool: ``build()`` fetches the sources and queues every encode,
+``ensure()`` builds a single image on demand, and concurrent calls for the
+same image share one in-flight job. ``picture_html`` emits the markup.
+
+Each manifest entry records the source URL and display width it was built
+from. An entry that no longer matches content.json counts as missing (as in
+assets.py): it is rebuilt, and until then the page shows the single-size
+icon. ``build()`` removes variant files no entry refers to any more.
+
+The server does not use the pool itself. Its ``__main__`` is the app script,
+which spawned workers would re-import, and forking a multi-threaded server
+is not safe either; ``warm()`` runs ``python variants.py build`` in a
+subprocess at startup and reloads the manifest when it exits.
+
+Usage:
+    python variants.py build [--offline fixtures/icons]
+"""
+import argparse
+import functools
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+from html import escape
+from io import BytesIO
+
+import assets
+
+VARIANT_DIR = os.path.join(assets.STATIC_DIR, "variants")
+MANIFEST_PATH = os.path.join(VARIANT_DIR, "manifest.json")
+STATIC_URL = "app/static/variants"
+DENSITIES = (1, 2, 3)
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp", "png": "image/png"}
+BUILD_TIMEOUT = 600
+
+
+# --- Encoding (runs in worker processes) ---
+@functools.lru_cache(maxsize=None)
+def output_formats():
+    """Output formats, best first. Asks Pillow, so it is only called when encoding."""
+    from PIL import features
+    return ("avif", "webp", "png") if features.check("avif") else ("webp", "png")
+
+
+def encode_variants(name, data, width, formats=None, densities=DENSITIES, source=None):
+    """
+    Encodes one source image at each density and format. Returns the manifest
+    entry (``source`` is the URL ``data`` came from) and a list of (file name,
+    bytes) to write. Pure function so it can run in a worker process.
+    """
+    from PIL import Image
+
+    formats = formats or output_formats()
+    img = Image.open(BytesIO(data))
+    # JPEG sources can be decoded at a reduced scale straight away.
+    if img.format == "JPEG":
+        img.draft("RGB", (width * max(densities), img.height))
+    img = img.convert("RGBA")
+    height = max(1, round(img.height * width / img.width))
+
+    entry = {"source": source, "width": width, "height": height, "sources": {fmt: [] for fmt in formats}}
+    files = []
+    seen_widths = set()
+    for density in densities:
+        # Never upscale: a 96px source gives 1x and 2x of a 50px icon, not 3x.
+        target = min(width * density, img.width)
+        if target in seen_widths:
+            continue
+        seen_widths.add(target)
+        scaled = img.copy()
+        scaled.thumbnail((target, img.height), Image.LANCZOS, reducing_gap=2.0)
+        for fmt in formats:
+            out = BytesIO()
+            if fmt == "png":
+                scaled.save(out, format="PNG", optimize=True)
+            elif fmt == "webp":
+                scaled.save(out, format="WEBP", quality=80, method=6)
+            else:
+                scaled.save(out, format="AVIF", quality=60)
+            encoded = out.getvalue()
+            digest = hashlib.sha256(encoded).hexdigest()[:12]
+            file_name = f"{name}-{target}w.{digest}.{fmt}"
+            files.append((file_name, encoded))
+            entry["sources"][fmt].append({"file": file_name, "width": target,
+                                          "density": round(target / width, 2), "bytes": len(encoded)})
+    return entry, files
+
+
+# --- Pool and in-flight de-duplication ---
+_pool = None
+_inflight = {}
+_lock = threading.Lock()
+_manifest = None
+_manifest_version = 0
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # spawn, not fork: callers may be multi-threaded. Workers re-import
+        # __main__, so this runs from the CLI and benchmarks, never the server.
+        _pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                    mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def load_manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH) as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def current(name):
+    """The manifest entry of ``name`` if it was built from its current URL and width, else None."""
+    registered = assets.icons().get(name)
+    entry = load_manifest().get(name)
+    return entry if registered and assets._matches(entry, *registered) else None
+
+
+def manifest_version():
+    """Bumped whenever a new image finishes, so callers can key caches on it."""
+    return _manifest_version
+
+
+def _store(name, future):
+    global _manifest, _manifest_version
+    try:
+        entry, files = future.result()
+    except Exception as e:
+        print(f"Variant build failed for {name}: {e}", file=sys.stderr)
+        with _lock:
+            _inflight.pop(name, None)
+        return
+    os.makedirs(VARIANT_DIR, exist_ok=True)
+    for file_name, encoded in files:
+        path = os.path.join(VARIANT_DIR, file_name)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(encoded)
+    with _lock:
+        manifest = dict(load_manifest())
+        manifest[name] = entry
+        tmp_path = MANIFEST_PATH + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, MANIFEST_PATH)
+        _manifest = manifest
+        _manifest_version += 1
+        _inflight.pop(name, None)
+
+
+def submit(name, offline_dir=None):
+    """
+    Queues ``name`` for encoding unless it is already built or in flight.
+    Returns the in-flight future, or None if there is nothing to do.
+    """
+    with _lock:
+        if current(name):
+            return None
+        if name in _inflight:
+            return _inflight[name]
+    # Fetch in this process (pooled session + disk cache), encode in the pool.
+    url, width = assets.icons()[name]
+    data = assets.fetch_source(name, url, offline_dir)
+    with _lock:
+        if name in _inflight:
+            return _inflight[name]
+        future = _get_pool().submit(encode_variants, name, data, width, source=url)
+        _inflight[name] = future
+    future.add_done_callback(lambda f: _store(name, f))
+    return future
+
+
+def ensure(name, offline_dir=None, timeout=None):
+    """Builds ``name`` on first request and waits for it; later calls are a dict lookup."""
+    future = submit(name, offline_dir)
+    if future is not None:
+        future.result(timeout=timeout)
+        # The done-callback may not have run yet; storing is idempotent.
+        _store(name, future)
+    return current(name)
+
+
+def _prune(registry):
+    """Drops entries of images no longer registered and deletes files no entry refers to."""
+    global _manifest
+    with _lock:
+        manifest = {name: entry for name, entry in load_manifest().items() if name in registry}
+        keep = {v["file"] for entry in manifest.values() for fmt in entry["sources"].values() for v in fmt}
+        if manifest != load_manifest():
+            tmp_path = MANIFEST_PATH + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, MANIFEST_PATH)
+            _manifest = manifest
+        for file_name in os.listdir(VARIANT_DIR) if os.path.isdir(VARIANT_DIR) else ():
+            if file_name not in keep and file_name != "manifest.json" and not file_name.endswith(".tmp"):
+                os.remove(os.path.join(VARIANT_DIR, file_name))
+
+
+def build(offline_dir=None):
+    """
+    Builds every registered image that is not built from its current source
+    yet, waits for the encodes, then prunes files from earlier builds.
+    """
+    pending = {}
+    for name in assets.icons():
+        try:
+            future = submit(name, offline_dir)
+        except Exception as e:
+            print(f"Variant source unavailable for {name}: {e}", file=sys.stderr)
+            continue
+        if future is not None:
+            pending[name] = future
+    for name, future in pending.items():
+        if future.exception() is None:
+            _store(name, future)  # the done-callback may not have run yet
+    _prune(assets.icons())
+    return load_manifest()
+
+
+def warm(offline_dir=None):
+    """
+    Builds the missing variants in a ``python variants.py build`` subprocess,
+    then reloads the manifest. Called once at startup, from the server.
+    """
+    global _manifest, _manifest_version
+    if all(current(name) for name in assets.icons()):
+        return
+    command = [sys.executable, os.path.abspath(__file__), "build"]
+    if offline_dir:
+        command.append(f"--offline={offline_dir}")
+    result = subprocess.run(command, stdout=subprocess.DEVNULL, timeout=BUILD_TIMEOUT)
+    with _lock:
+        _manifest = None
+        _manifest_version += 1
+    if result.returncode:
+        raise RuntimeError(f"variants.py build exited with status {result.returncode}")
+
+
+# --- Markup helpers ---
+def srcset(name, fmt):
+    """``srcset`` attribute value for one format, e.g. ``a-50w.png 1x, a-100w.png 2x``."""
+    entry = current(name)
+    if not entry:
+        return ""
+    return ", ".join(f"{STATIC_URL}/{s['file']} {s['density']:g}x" for s in entry["sources"].get(fmt, []))
+
+
+def picture_html(name, alt="", style="", src=None, width=None, owner=""):
+    """
+    ``<picture>`` markup for a registered image. Falls back to a plain
+    ``<img>`` of the single-size asset while variants are still being built.
+    ``src``/``width`` describe the caller's image: one the registry does not
+    know under that name and URL (another tenant's icon, see tenants.py) is
+    inlined through ``assets.tenant_icon_src`` and charged to ``owner``.
+    """
+    registered = assets.icons().get(name)
+    alt = escape(alt)
+    style_attr = f' style="{escape(style)}"' if style else ""
+    if registered is None or (src and registered[0] != src):
+        width_attr = f' width="{width}"' if width else ""
+        src = assets.tenant_icon_src(owner, name, src, width) if src and width else ""
+        return f'<img src="{escape(src)}"{width_attr} alt="{alt}" loading="lazy"{style_attr}>'
+    width = registered[1]
+    entry = current(name)
+    if not entry:
+        return f'<img src="{escape(assets.icon_src(name))}" width="{width}" alt="{alt}"{style_attr}>'
+    sources = "".join(
+        f'<source type="{MIME_TYPES[fmt]}" srcset="{srcset(name, fmt)}">'
+        for fmt in entry["sources"] if fmt != "png"
+    )
+    fallback = entry["sources"]["png"][0]
+    return (
+        f'<picture>{sources}'
+        f'<img src="{STATIC_URL}/{fallback["file"]}" srcset="{srcset(name, "png")}" '
+        f'width="{entry["width"]}" height="{entry["height"]}" alt="{alt}" loading="lazy"{style_attr}>'
+        f'</picture>'
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build responsive image variants.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--offline", nargs="?", const=assets.FIXTURE_DIR, default=None)
+    args = parser.parse_args()
+    manifest = build(args.offline)
+    _get_pool().shutdown(wait=True)
+    for image_name, image in sorted(manifest.items()):
+        for fmt, variants in image["sources"].items():
+            sizes = ", ".join(f"{v['width']}w={v['bytes']}B" for v in variants)
+            print(f"{image_name:10} {fmt:5} {sizes}")
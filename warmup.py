@@ -0,0 +1,92 @@
+"""
+Startup work, moved off the first visitor's request.
+
+``start()`` runs once per process. It starts the metrics flush, the link
+checker and the analytics writer, then warms every cache a script run reads
+on a background thread:
+- the local documents (resume, thesis) published to static/files;
+- content.json parsed, the compiled section HTML and the search index;
+- the minified stylesheet;
+- the self-hosted icons and their responsive variants (fetch + encode).
+
+Until the icons are built, pages use the original icon URLs instead of
+waiting for them.
+
+``streamlit run haha.py`` calls ``start()`` from the first script run. To
+warm up right after the server starts, before anyone visits, launch through
+this module instead:
+
+    python warmup.py [streamlit run options]     # e.g. --server.port 8080
+"""
+import os
+import sys
+import threading
+import time
+
+import analytics
+import assets
+import content
+import documents
+import linkcheck
+import metrics
+import render
+import search
+import styles
+import variants
+
+_started = False
+_start_lock = threading.Lock()
+_done = threading.Event()
+timings = {}  # step -> seconds, for the import/startup report
+
+
+def warm():
+    """Fills the caches in order of what a first page view needs."""
+    steps = (
+        ("documents", documents.publish),  # cheap, and the compiled links depend on it
+        ("content", lambda: render.compile_site(content.load_content())),
+        ("search", lambda: search.index_for(content.load_content())),
+        ("styles", styles.stylesheet),
+        ("icons", assets.ensure_icons),
+        ("variants", variants.warm),
+    )
+    for name, step in steps:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:  # a cold cache is slower, not broken
+            print(f"warmup: {name} failed: {type(e).__name__}: {e}", file=sys.stderr)
+        timings[name] = time.perf_counter() - start
+    _done.set()
+
+
+def start():
+    """Starts the background services and the warm-up thread, once per process."""
+    global _started
+    if _started:
+        return
+    with _start_lock:
+        if _started:
+            return
+        metrics.start()
+        linkcheck.start()
+        analytics.start()
+        threading.Thread(target=warm, name="warmup", daemon=True).start()
+        _started = True
+
+
+def wait(timeout=None):
+    """Blocks until the warm-up finished; True if it did within ``timeout``."""
+    return _done.wait(timeout)
+
+
+if __name__ == "__main__":
+    from streamlit.web import cli
+
+    # This file runs as __main__; start the copy the app script imports, so
+    # the script's warmup.start() sees it already running.
+    import warmup
+    warmup.start()
+    app = os.path.join(os.path.dirname(os.path.abspath(__file__)), "haha.py")
+    sys.argv = ["streamlit", "run", app] + sys.argv[1:]
+    sys.exit(cli.main())